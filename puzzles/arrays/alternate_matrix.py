@@ -4,12 +4,29 @@
 """
 Read the rows of a matrix (as a 2D array) alternatively from left to right,
 right to left, and so on, and return them as a 1D array.
+
+The matrix can also be given as a contiguous row-major buffer (anything
+supporting the buffer protocol, eg. `array.array`, `memoryview`, NumPy
+array) plus its shape.
 """
 
-from typing import Iterator, List
+from array import array
+from typing import Any, Iterator, List, Optional, Tuple
+import mmap
+import os
+import sys
+import tempfile
+import timeit
 import unittest
 
 
+Shape = Tuple[int, int]
+
+
+# Default number of elements per output chunk, when streaming from files.
+DEFAULT_BLOCK_LEN = 64 * 1024
+
+
 def transform_simple(matrix: List[List]) -> List:
     """
     Time: O(r * c), where r=number of rows, c=number of columns
@@ -70,11 +87,276 @@ def transform_manual(matrix: List[List]) -> List:
     return array
 
 
+def flat_view(buffer: Any, shape: Optional[Shape] = None) -> Tuple[
+        memoryview, Shape]:
+
+    """
+    Get a flat (1D) view over a row-major buffer, along with its matrix
+    shape, which defaults to the buffer's own shape when it's 2D.
+    """
+
+    view = memoryview(buffer)
+
+    if shape is None:
+        if view.ndim != 2:
+            raise ValueError('shape required for non-2D buffer')
+
+        shape = (view.shape[0], view.shape[1])
+
+    if view.ndim != 1:
+        view = view.cast('B').cast(view.format)
+
+    if len(view) != shape[0] * shape[1]:
+        raise ValueError('shape %r mismatch for buffer of length %s'
+            % (shape, len(view)))
+
+    return (view, shape)
+
+
+def transform_buffer(
+        buffer: Any,
+        shape: Optional[Shape] = None,
+        out: Any = None) -> memoryview:
+
+    """
+    Copy rows in bulk into a single output buffer (a new one by default),
+    with one (reversed, when needed) strided slice per row, instead of one
+    element at-a-time.
+
+    Time: O(r * c), where r=number of rows, c=number of columns
+    Space: ditto
+    """
+
+    (view, (num_rows, num_cols)) = flat_view(buffer, shape)
+
+    if out is None:
+        out = bytearray(view.nbytes)
+
+    out_view = memoryview(out).cast('B').cast(view.format)
+
+    for row in range(num_rows):
+        start = row * num_cols
+        stop = start + num_cols
+
+        if row % 2 == 0:
+            out_view[start:stop] = view[start:stop]
+        else:
+            out_view[start:stop] = view[
+                stop - 1 : (start - 1 if start > 0 else None) : -1]
+
+    return out_view
+
+
+def transform_buffer_list(matrix: List[List]) -> List:
+    shape = (len(matrix), len(matrix[0]) if matrix else 0)
+    buffer = to_buffer(matrix)
+    return from_buffer(buffer, transform_buffer(buffer, shape).tolist())
+
+
+class AlternateView:
+    """
+    Lazy read-only view of a row-major buffer, indexable as the transformed
+    1D array, by remapping each index into the buffer without any copying.
+
+    Time: O(1) per element
+    Space: O(1)
+    """
+
+    def __init__(self, buffer: Any, shape: Optional[Shape] = None):
+        (self._view, (self._num_rows, self._num_cols)) = flat_view(
+            buffer, shape)
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += len(self._view)
+
+        if (index < 0) or (index >= len(self._view)):
+            raise IndexError(index)
+
+        (row, col) = divmod(index, self._num_cols)
+
+        if row % 2 == 1:
+            col = self._num_cols - 1 - col
+
+        return self._view[row * self._num_cols + col]
+
+    def __iter__(self) -> Iterator:
+        num_cols = self._num_cols
+
+        for row in range(self._num_rows):
+            start = row * num_cols
+            stop = start + num_cols
+
+            if row % 2 == 0:
+                yield from self._view[start:stop]
+            else:
+                yield from self._view[
+                    stop - 1 : (start - 1 if start > 0 else None) : -1]
+
+
+def transform_view_list(matrix: List[List]) -> List:
+    shape = (len(matrix), len(matrix[0]) if matrix else 0)
+    buffer = to_buffer(matrix)
+    view = AlternateView(buffer, shape)
+    return from_buffer(buffer, [view[i] for i in range(len(view))])
+
+
+def transform_file(
+        path: str,
+        num_cols: int,
+        format: str = 'l',
+        block_len: int = DEFAULT_BLOCK_LEN) -> Iterator[memoryview]:
+
+    """
+    Stream a matrix stored as a row-major binary file of `format` elements
+    (see the `struct` module), through a read-only memory map, yielding the
+    transformed elements in chunks of up to `block_len` elements.
+
+    Rows are copied (and odd ones reversed) in blocks of up to `block_len`
+    elements, so that only one block-sized output buffer is ever allocated,
+    no matter how large the matrix or its rows are. The same buffer is reused
+    for every chunk, so each one must be consumed before getting the next.
+
+    Time: O(r * c), where r=number of rows, c=number of columns
+    Space: O(b), where b=block length
+    """
+
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            view = memoryview(mm).cast('B').cast(format)
+            out = memoryview(bytearray(block_len * view.itemsize)).cast(
+                format)
+            segment = None
+
+            try:
+                if len(view) % num_cols != 0:
+                    raise ValueError('file length %s not a multiple of %s'
+                        ' columns' % (len(view), num_cols))
+
+                filled = 0
+
+                for row in range(len(view) // num_cols):
+                    start = row * num_cols
+                    stop = start + num_cols
+
+                    for block_start in range(start, stop, block_len):
+                        block_stop = min(block_start + block_len, stop)
+
+                        if row % 2 == 0:
+                            segment = view[block_start:block_stop]
+                        else:
+                            # Mirror the block's position within the row.
+                            (block_start, block_stop) = (
+                                start + stop - block_stop,
+                                start + stop - block_start)
+
+                            reversed_stop = (
+                                block_start - 1 if block_start > 0 else None)
+
+                            segment = view[
+                                block_stop - 1 : reversed_stop : -1]
+
+                        while len(segment) > 0:
+                            count = min(len(segment), block_len - filled)
+                            out[filled : filled + count] = segment[:count]
+                            segment = segment[count:]
+                            filled += count
+
+                            if filled == block_len:
+                                yield out
+                                filled = 0
+
+                if filled > 0:
+                    yield out[:filled]
+            finally:
+                # Release all views into the memory map, so it can be closed.
+                segment = None
+                view.release()
+
+
+def transform_file_list(matrix: List[List]) -> List:
+    buffer = to_buffer(matrix)
+
+    with tempfile.NamedTemporaryFile() as file:
+        file.write(buffer)
+        file.flush()
+
+        return from_buffer(buffer, [elem
+            for chunk in transform_file(
+                file.name,
+                len(matrix[0]) if matrix else 1,
+                memoryview(buffer).format)
+            for elem in chunk.tolist()])
+
+
+def to_buffer(matrix: List[List]) -> Any:
+    """
+    Pack a matrix of integers into a row-major buffer, or of (single byte)
+    strings into a bytes buffer, as used by tests and benchmarks.
+    """
+
+    elems = [elem for row in matrix for elem in row]
+
+    if any(isinstance(elem, str) for elem in elems):
+        return ''.join(elems).encode()
+    else:
+        return array('l', elems)
+
+
+def from_buffer(buffer: Any, elems: List) -> List:
+    """
+    Unpack elements read from a buffer made by `to_buffer`.
+    """
+
+    if isinstance(buffer, bytes):
+        return [chr(elem) for elem in elems]
+    else:
+        return elems
+
+
+def benchmark(side_lens: Tuple[int, ...] = (10, 100, 1000)) -> None:
+    list_impls = [transform_simple, transform_manual, transform_iter_list]
+
+    for side_len in side_lens:
+        matrix = [list(range(row * side_len, (row + 1) * side_len))
+            for row in range(side_len)]
+        buffer = to_buffer(matrix)
+        shape = (side_len, side_len)
+        number = max(1, 10**6 // side_len**2)
+
+        timings = [
+            (transform.__name__,
+                lambda transform=transform: transform(matrix))
+            for transform in list_impls]
+
+        timings.append(('transform_buffer',
+            lambda: transform_buffer(buffer, shape)))
+        timings.append(('AlternateView',
+            lambda: list(AlternateView(buffer, shape))))
+
+        for (name, run) in timings:
+            seconds = timeit.timeit(run, number=number) / number
+            print('%sx%s %-20s %10.1f us' % (
+                side_len, side_len, name, seconds * 1e6))
+
+
 class Test (unittest.TestCase):
     transform_impls = {
         transform_simple,
         transform_manual,
         transform_iter_list,
+        transform_buffer_list,
+        transform_view_list,
+        transform_file_list,
     }
 
     def test_square_matrix(self):
@@ -111,5 +393,93 @@ class Test (unittest.TestCase):
                 self.assertEqual(transform([]), [])
 
 
+class TestBuffer (unittest.TestCase):
+    def test_memoryview_with_shape(self):
+        buffer = memoryview(array('d', [1, 2, 3, 4, 5, 6]))
+
+        self.assertEqual(
+            transform_buffer(buffer, (3, 2)).tolist(),
+            [1, 2, 4, 3, 5, 6])
+
+        self.assertEqual(
+            list(AlternateView(buffer, (3, 2))),
+            [1, 2, 4, 3, 5, 6])
+
+    def test_2d_buffer_shape(self):
+        buffer = memoryview(bytes(range(6))).cast('B', (2, 3))
+
+        self.assertEqual(
+            transform_buffer(buffer).tolist(),
+            [0, 1, 2, 5, 4, 3])
+
+        self.assertEqual(AlternateView(buffer)[-3], 5)
+
+    def test_output_buffer(self):
+        out = array('l', [0] * 4)
+        transform_buffer(array('l', [1, 2, 3, 4]), (2, 2), out)
+        self.assertEqual(out.tolist(), [1, 2, 4, 3])
+
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            transform_buffer(array('l', [1, 2, 3]), (2, 2))
+
+        with self.assertRaises(ValueError):
+            AlternateView(array('l', [1, 2, 3, 4]))
+
+    def test_view_index_out_of_bounds(self):
+        view = AlternateView(array('l', [1, 2, 3, 4]), (2, 2))
+
+        with self.assertRaises(IndexError):
+            view[4]
+
+        with self.assertRaises(IndexError):
+            view[-5]
+
+
+class TestFile (unittest.TestCase):
+    def setUp(self):
+        self.file = tempfile.NamedTemporaryFile()
+
+    def tearDown(self):
+        self.file.close()
+
+    def write_matrix(self, matrix: List[List]) -> None:
+        self.file.write(to_buffer(matrix))
+        self.file.flush()
+
+    def test_block_lengths(self):
+        matrix = [list(range(row * 7, (row + 1) * 7)) for row in range(5)]
+        self.write_matrix(matrix)
+
+        for block_len in [1, 2, 3, 7, 10, 100]:
+            with self.subTest(block_len=block_len):
+                chunks = [chunk.tolist()
+                    for chunk in transform_file(
+                        self.file.name, 7, block_len=block_len)]
+
+                self.assertTrue(all(len(chunk) <= block_len
+                    for chunk in chunks))
+
+                self.assertEqual(
+                    [elem for chunk in chunks for elem in chunk],
+                    transform_simple(matrix))
+
+    def test_stop_early(self):
+        self.write_matrix([[1, 2], [3, 4]])
+        chunks = transform_file(self.file.name, 2, block_len=1)
+
+        self.assertEqual(next(chunks).tolist(), [1])
+        chunks.close()
+
+    def test_num_cols_mismatch(self):
+        self.write_matrix([[1, 2, 3]])
+
+        with self.assertRaises(ValueError):
+            list(transform_file(self.file.name, 2))
+
+
 if __name__ == '__main__':
-    unittest.main(verbosity=2)
+    if sys.argv[1:] == ['--benchmark']:
+        benchmark()
+    else:
+        unittest.main(verbosity=2)
@@ -5,9 +5,36 @@
 Subtract one array from another, including all occurrences of each item.
 """
 
-from typing import Any, Dict, Iterator, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, \
+    Tuple
+import collections
+import heapq
+import itertools
+import os
+import pickle
+import random
+import sys
+import tempfile
+import timeit
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Max. ratio of an integer bitmap's length (the value range of array y) to
+# the total length of both arrays, for it to be used instead of sorting.
+BITMAP_MAX_RANGE_RATIO = 8
+
+# Default max. number of items sorted in memory at-a-time, per run.
+DEFAULT_RUN_LEN = 1_000_000
+
+# Number of items per pickled batch, in run files.
+RUN_BATCH_LEN = 4096
+
 
 def diff_array_naive(x: List, y: List) -> List:
     """
@@ -53,11 +80,282 @@ def diff_array_iter_list(x: List, y: List) -> List:
     return list(diff_array_iter(x, y))
 
 
+def diff_array_sorted(x: List, y: List) -> List:
+    """
+    Sort both arrays and merge them to find which items of array x are in
+    array y, for items that are orderable but not necessarily hashable.
+
+    Time: O(n*log(n) + m*log(m)), where n=length of array x, m=length of
+        array y
+    Space: O(n+m)
+    """
+
+    x_order = sorted(range(len(x)), key=x.__getitem__)
+    sorted_y = sorted(y)
+    was_found = bytearray(len(x))
+    y_pos = 0
+
+    for x_pos in x_order:
+        x_elem = x[x_pos]
+
+        while (y_pos < len(sorted_y)) and (sorted_y[y_pos] < x_elem):
+            y_pos += 1
+
+        if (y_pos < len(sorted_y)) and (sorted_y[y_pos] == x_elem):
+            was_found[x_pos] = True
+
+    return [x_elem for (x_elem, found) in zip(x, was_found) if not found]
+
+
+def diff_array_hash(x: List, y: List) -> List:
+    """
+    Look up items of array x in a set of array y, built only once.
+
+    Falls back to `diff_array_sorted` when items aren't hashable, or to
+    `diff_array_naive` when they aren't orderable either.
+
+    Time: O(n+m), where n=length of array x, m=length of array y
+    Space: O(m), where m=length of array y
+    """
+
+    try:
+        y_set = frozenset(y)
+        return [x_elem for x_elem in x if x_elem not in y_set]
+    except TypeError:
+        pass
+
+    try:
+        return diff_array_sorted(x, y)
+    except TypeError:
+        return diff_array_naive(x, y)
+
+
+def diff_array_numeric(x: Any, y: Any) -> Any:
+    """
+    Vectorized diff for homogeneous integer or floating point arrays, which
+    returns a compact NumPy array. Integers in a small enough value range are
+    looked up in a bitmap of array y, otherwise in a sorted copy of array y
+    with a binary search.
+
+    Falls back to `diff_array_hash` when NumPy isn't available, the arrays
+    aren't numeric, aren't of the same kind (both integer or both floating
+    point), or when integers in a list don't convert exactly to floats.
+
+    Time: O(n+m+r) with a bitmap, where n=length of array x, m=length of
+        array y, r=value range of array y; O((n+m)*log(m)) otherwise
+    Space: O(n+r) with a bitmap, O(n+m) otherwise
+    """
+
+    if numpy is None:
+        return diff_array_hash(x, y)
+
+    x_array = numpy.asarray(x)
+    y_array = numpy.asarray(y)
+
+    if (x_array.ndim != 1) or (y_array.ndim != 1) \
+            or (x_array.dtype.kind not in 'iuf') \
+            or (y_array.dtype.kind not in 'iuf'):
+        return diff_array_hash(x, y)
+
+    if not is_exact_array(x, x_array) or not is_exact_array(y, y_array):
+        return diff_array_hash(x, y)
+
+    if (len(x_array) == 0) or (len(y_array) == 0):
+        return x_array.copy()
+
+    if x_array.dtype.kind != y_array.dtype.kind:
+        return diff_array_hash(x, y)
+
+    if (x_array.dtype.kind in 'iu') and (y_array.dtype.kind in 'iu'):
+        y_min = int(y_array.min())
+        y_max = int(y_array.max())
+        value_range = y_max - y_min + 1
+        max_range = BITMAP_MAX_RANGE_RATIO * (len(x_array) + len(y_array))
+
+        if value_range <= max_range:
+            bitmap = numpy.zeros(value_range, dtype=bool)
+            bitmap[y_array - y_min] = True
+
+            was_found = (x_array >= y_min) & (x_array <= y_max)
+            was_found[was_found] = bitmap[x_array[was_found] - y_min]
+
+            return x_array[~was_found]
+
+    sorted_y = numpy.unique(y_array)
+    pos = numpy.minimum(
+        numpy.searchsorted(sorted_y, x_array),
+        len(sorted_y) - 1)
+
+    return x_array[sorted_y[pos] != x_array]
+
+
+def is_exact_array(values: Any, array: Any) -> bool:
+    """
+    Checks that converting values to a NumPy array lost no precision, such
+    as for large integers mixed with floats in a list.
+    """
+
+    if isinstance(values, numpy.ndarray) or (array.dtype.kind != 'f'):
+        return True
+
+    return array.tolist() == list(values)
+
+
+def diff_array_numeric_list(x: List, y: List) -> List:
+    result = diff_array_numeric(x, y)
+
+    if (numpy is not None) and isinstance(result, numpy.ndarray):
+        return result.tolist()
+
+    return result
+
+
+def write_sorted_run(items: List, path: str) -> str:
+    """
+    Sort items and write them to a run file, as pickled batches.
+    """
+
+    items.sort()
+
+    with open(path, 'wb') as file:
+        for start in range(0, len(items), RUN_BATCH_LEN):
+            pickle.dump(
+                items[start : start + RUN_BATCH_LEN],
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL)
+
+    return path
+
+
+def read_run(path: str) -> Iterator:
+    with open(path, 'rb') as file:
+        while True:
+            try:
+                yield from pickle.load(file)
+            except EOFError:
+                break
+
+
+def write_sorted_runs(
+        items: Iterable,
+        dir_path: str,
+        prefix: str,
+        run_len: int,
+        pool: Optional[ProcessPoolExecutor] = None,
+        num_processes: int = 1) -> List[str]:
+
+    """
+    Split items into sorted run files of up to `run_len` items each, sorting
+    them in a process pool of `num_processes` processes if given. At most one
+    run per process (plus one) is kept in memory at-a-time.
+    """
+
+    items = iter(items)
+    paths = []
+    pending: collections.deque = collections.deque()
+
+    for run_num in itertools.count():
+        run = list(itertools.islice(items, run_len))
+
+        if not run:
+            break
+
+        path = os.path.join(dir_path, '%s-%d' % (prefix, run_num))
+
+        if pool is None:
+            paths.append(write_sorted_run(run, path))
+            continue
+
+        if len(pending) > num_processes:
+            paths.append(pending.popleft().result())
+
+        pending.append(pool.submit(write_sorted_run, run, path))
+
+    paths.extend(future.result() for future in pending)
+    return paths
+
+
+def diff_array_external(
+        x: Iterable,
+        y: Iterable,
+        run_len: int = DEFAULT_RUN_LEN,
+        num_processes: Optional[int] = None,
+        temp_dir: Optional[str] = None) -> Iterator:
+
+    """
+    Disk-backed diff for arrays larger than memory: both arrays are split
+    into sorted run files, then each one is k-way merged back in order, and
+    both merged streams are walked side-by-side to skip every item of x
+    that's in y. Runs can be sorted in a pool of `num_processes` processes.
+
+    Unlike the other implementations, the remaining items of x come out in
+    sorted order, not in their original order.
+
+    Time: O(n*log(n) + m*log(m)), where n=length of array x, m=length of
+        array y
+    Space: O(r + k) in memory, where r=run length, k=number of runs; O(n+m)
+        on disk
+    """
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as dir_path:
+        if num_processes is None:
+            x_runs = write_sorted_runs(x, dir_path, 'x', run_len)
+            y_runs = write_sorted_runs(y, dir_path, 'y', run_len)
+        else:
+            with ProcessPoolExecutor(max_workers=num_processes) as pool:
+                x_runs = write_sorted_runs(
+                    x, dir_path, 'x', run_len, pool, num_processes)
+                y_runs = write_sorted_runs(
+                    y, dir_path, 'y', run_len, pool, num_processes)
+
+        sorted_y = heapq.merge(*map(read_run, y_runs))
+        end = object()
+        y_elem = next(sorted_y, end)
+
+        for x_elem in heapq.merge(*map(read_run, x_runs)):
+            while (y_elem is not end) and (y_elem < x_elem):
+                y_elem = next(sorted_y, end)
+
+            if (y_elem is end) or (y_elem != x_elem):
+                yield x_elem
+
+
+def benchmark(sizes: Tuple[int, ...] = (1, 10, 100, 1000, 5000)) -> None:
+    """
+    Time every implementation on arrays x and y of the same size, sharing
+    about half of their items, to show where the crossover points are.
+    """
+
+    impls: List[Callable[[List, List], List]] = [
+        diff_array_naive,
+        diff_array_iter_list,
+        diff_array_sorted,
+        diff_array_hash,
+    ]
+
+    rand = random.Random(0)
+
+    for size in sizes:
+        x = [rand.randrange(2 * size) for i in range(size)]
+        y = [rand.randrange(2 * size) for i in range(size)]
+        number = max(1, 10**5 // size**2)
+
+        for diff_array in impls:
+            seconds = timeit.timeit(
+                lambda: diff_array(x, y), number=number) / number
+
+            print('%6s %-22s %12.1f us' % (
+                size, diff_array.__name__, seconds * 1e6))
+
+
 class Test (unittest.TestCase):
 
     diff_array_impls = {
         diff_array_naive,
         diff_array_iter_list,
+        diff_array_sorted,
+        diff_array_hash,
+        diff_array_numeric_list,
     }
 
     def test_empty_arrays(self):
@@ -101,6 +399,104 @@ class Test (unittest.TestCase):
                     diff_array([0, 1, 2, 1, 3, 1, 3], [1, 2]),
                     [0, 3, 3])
 
+    def test_unhashable_elements(self):
+        for diff_array in [diff_array_naive, diff_array_sorted,
+                diff_array_hash]:
+
+            with self.subTest(diff_array):
+                self.assertEqual(
+                    diff_array([[0], [1], [2], [1]], [[1], [3]]),
+                    [[0], [2]])
+
+    def test_unhashable_unorderable_elements(self):
+        self.assertEqual(
+            diff_array_hash([{1: 1}, {2: 2}, {1: 1}], [{2: 2}]),
+            [{1: 1}, {1: 1}])
+
+
+@unittest.skipIf(numpy is None, 'NumPy not available')
+class TestNumeric (unittest.TestCase):
+    def assertDiffMatchesNaive(self, x: List, y: List) -> None:
+        result = diff_array_numeric(x, y)
+
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual(result.tolist(), diff_array_naive(x, y))
+
+    def test_small_int_range(self):
+        rand = random.Random(0)
+
+        self.assertDiffMatchesNaive(
+            [rand.randrange(-50, 50) for i in range(200)],
+            [rand.randrange(-20, 30) for i in range(50)])
+
+    def test_large_int_range(self):
+        rand = random.Random(0)
+
+        self.assertDiffMatchesNaive(
+            [rand.randrange(10**12) for i in range(200)]
+                + [0, 10**12 - 1],
+            [rand.randrange(10**12) for i in range(50)] + [0, 10**12 - 1])
+
+    def test_floats(self):
+        self.assertDiffMatchesNaive(
+            [0.5, 1.0, 2.5, 1.0, -3.0],
+            [1.0, 2.5, 4])
+
+    def test_mixed_int_float_precision(self):
+        for x, y in [
+                ([2**53 + 1, 3], [float(2**53)]),
+                ([float(2**53), 3], [2**53 + 1]),
+                ([2**53 + 1, 3.0], [float(2**53)]),
+                ([-1, 2**63], [2**63 - 1]),
+                ([2**53 + 1, 0.5], [])]:
+
+            with self.subTest(x=x, y=y):
+                self.assertEqual(
+                    list(diff_array_numeric(x, y)),
+                    diff_array_naive(x, y))
+
+    def test_non_numeric_fallback(self):
+        self.assertEqual(
+            diff_array_numeric(['a', 'b', 'a'], ['b']),
+            ['a', 'a'])
+
+
+class TestExternal (unittest.TestCase):
+    def assertDiffMatchesNaive(self, x: List, y: List, **kwargs: Any) -> None:
+        self.assertEqual(
+            list(diff_array_external(x, y, **kwargs)),
+            sorted(diff_array_naive(x, y)))
+
+    def test_empty_arrays(self):
+        self.assertDiffMatchesNaive([], [])
+        self.assertDiffMatchesNaive([], [1, 2])
+        self.assertDiffMatchesNaive([2, 1], [])
+
+    def test_multiple_runs(self):
+        rand = random.Random(0)
+        x = [rand.randrange(50) for i in range(200)]
+        y = [rand.randrange(50) for i in range(100)]
+
+        for run_len in [1, 2, 7, 1000]:
+            with self.subTest(run_len=run_len):
+                self.assertDiffMatchesNaive(x, y, run_len=run_len)
+
+    def test_process_pool(self):
+        rand = random.Random(0)
+        x = [rand.randrange(50) for i in range(200)]
+        y = [rand.randrange(50) for i in range(100)]
+
+        self.assertDiffMatchesNaive(x, y, run_len=9, num_processes=2)
+
+    def test_iterator_input(self):
+        self.assertEqual(
+            list(diff_array_external(
+                iter([0, 1, 2, 1, 3, 1, 3]), iter([1, 2]), run_len=2)),
+            [0, 3, 3])
+
 
 if __name__ == '__main__':
-    unittest.main(verbosity=2)
+    if sys.argv[1:] == ['--benchmark']:
+        benchmark()
+    else:
+        unittest.main(verbosity=2)
@@ -5,11 +5,29 @@
 Rotate a square matrix 90 degrees clockwise.
 """
 
+from array import array
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Any, List, Optional, Tuple
+import math
+import mmap
+import os
+import sys
+import tempfile
+import timeit
 import unittest
 
 
+# Default side length of square tiles, for tiled rotation.
+DEFAULT_TILE_LEN = 64
+
+# Default side length of square tiles, for tiled rotation of files.
+DEFAULT_FILE_TILE_LEN = 512
+
+# Unsigned integer `struct` format by element size, used to move elements of
+# any type around as opaque values.
+FORMAT_BY_ITEMSIZE = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
 def rotate_matrix(matrix: List[List]) -> List[List]:
     """
     Time: O(n), where n=number of elements in matrix
@@ -107,8 +125,16 @@ def rotate_matrix_in_place(matrix: List[List]) -> List[List]:
             # Rotate 4 sides at-a-time only, so that no extra space is needed
             # to keep track of values to be carried over.
             for step in range(4):
+                # Rotate relative to the current inner matrix, since that's
+                # what the side length refers to.
                 (next_row, next_col) = rotate_clockwise(
-                    row, col, direction, side_len)
+                    row - row_col_offset,
+                    col - row_col_offset,
+                    direction,
+                    side_len)
+
+                next_row += row_col_offset
+                next_col += row_col_offset
 
                 next_value = matrix[next_row][next_col]
                 matrix[next_row][next_col] = previous_value
@@ -126,10 +152,353 @@ def rotate_matrix_in_place(matrix: List[List]) -> List[List]:
     return matrix
 
 
+def rotate_matrix_tiled(
+        matrix: List[List],
+        tile_len: int = DEFAULT_TILE_LEN) -> List[List]:
+
+    """
+    Rotate in place, moving each value straight to its position in closed
+    form, `(row, col) -> (col, n-1-row)`, 4 values at-a-time (one per
+    quadrant). The top-left quadrant is walked in square tiles, so that the
+    4 regions being accessed at any time each stay small.
+
+    Time: O(n), where n=number of elements in matrix
+    Space: O(1)
+    """
+
+    side_len = len(matrix)
+    last = side_len - 1
+    num_rows = side_len // 2
+    num_cols = (side_len + 1) // 2
+
+    for tile_row in range(0, num_rows, tile_len):
+        for tile_col in range(0, num_cols, tile_len):
+            for row in range(tile_row, min(tile_row + tile_len, num_rows)):
+                for col in range(tile_col, min(tile_col + tile_len, num_cols)):
+                    value = matrix[row][col]
+                    matrix[row][col] = matrix[last - col][row]
+                    matrix[last - col][row] = matrix[last - row][last - col]
+                    matrix[last - row][last - col] = matrix[col][last - row]
+                    matrix[col][last - row] = value
+
+    return matrix
+
+
+def rotate_block(
+        block: memoryview,
+        num_rows: int,
+        num_cols: int,
+        out: memoryview) -> None:
+
+    """
+    Rotate a row-major block into another one, one strided (reversed) column
+    slice at-a-time.
+    """
+
+    last_row_start = (num_rows - 1) * num_cols
+
+    for col in range(num_cols):
+        stop = col - num_cols
+        out[col * num_rows : (col + 1) * num_rows] = block[
+            last_row_start + col : (stop if stop >= 0 else None) : -num_cols]
+
+
+def rotate_file_in_place(
+        path: str,
+        itemsize: int = 1,
+        tile_len: int = DEFAULT_FILE_TILE_LEN) -> None:
+
+    """
+    Rotate in place a square matrix stored as a row-major binary file of
+    fixed size elements (1, 2, 4 or 8 bytes), through a memory map.
+
+    The top-left quadrant is walked in square tiles. For each one, its 4
+    matching blocks (one per quadrant, ie. one per side of its rings) are
+    read with one contiguous slice per row, each rotated in memory into the
+    next one's place, and written back the same way. Only 8 tile-sized
+    buffers are ever allocated, no matter how large the file is.
+
+    Time: O(n), where n=number of elements in matrix
+    Space: O(t^2), where t=tile length
+    """
+
+    if itemsize not in FORMAT_BY_ITEMSIZE:
+        raise ValueError('unsupported element size: %s' % itemsize)
+
+    format = FORMAT_BY_ITEMSIZE[itemsize]
+    file_size = os.path.getsize(path)
+    side_len = math.isqrt(file_size // itemsize)
+
+    if side_len * side_len * itemsize != file_size:
+        raise ValueError('file size %s not a square matrix of %s byte'
+            ' elements' % (file_size, itemsize))
+
+    if side_len < 2:
+        return
+
+    last = side_len - 1
+    num_rows = side_len // 2
+    num_cols = (side_len + 1) // 2
+
+    def new_block() -> memoryview:
+        return memoryview(bytearray(tile_len * tile_len * itemsize)).cast(
+            format)
+
+    blocks = [new_block() for i in range(4)]
+    rotated_blocks = [new_block() for i in range(4)]
+
+    with open(path, 'r+b') as file, \
+            mmap.mmap(file.fileno(), 0) as mm, \
+            memoryview(mm) as raw:
+
+        view = raw.cast(format)
+
+        def read_block(block, row, col, height, width):
+            for i in range(height):
+                start = (row + i) * side_len + col
+                block[i * width : (i + 1) * width] = view[
+                    start : start + width]
+
+        def write_block(block, row, col, height, width):
+            for i in range(height):
+                start = (row + i) * side_len + col
+                view[start : start + width] = block[
+                    i * width : (i + 1) * width]
+
+        try:
+            for tile_row in range(0, num_rows, tile_len):
+                height = min(tile_len, num_rows - tile_row)
+
+                for tile_col in range(0, num_cols, tile_len):
+                    width = min(tile_len, num_cols - tile_col)
+
+                    # Top-left corner and shape of the tile's block in each
+                    # quadrant, clockwise, as each one rotates into the next.
+                    regions = [
+                        (tile_row, tile_col, height, width),
+                        (tile_col, last - (tile_row + height - 1),
+                            width, height),
+                        (last - (tile_row + height - 1),
+                            last - (tile_col + width - 1), height, width),
+                        (last - (tile_col + width - 1), tile_row,
+                            width, height),
+                    ]
+
+                    for (block, region) in zip(blocks, regions):
+                        read_block(block, *region)
+
+                    for i in range(4):
+                        (_, _, block_height, block_width) = regions[i]
+
+                        rotate_block(
+                            blocks[i],
+                            block_height,
+                            block_width,
+                            rotated_blocks[(i + 1) % 4])
+
+                    for (block, region) in zip(rotated_blocks, regions):
+                        write_block(block, *region)
+        finally:
+            view.release()
+
+        mm.flush()
+
+
+def rotate_matrix_file(matrix: List[List]) -> List[List]:
+    side_len = len(matrix)
+
+    with tempfile.NamedTemporaryFile() as file:
+        file.write(array('q', [elem for row in matrix for elem in row]))
+        file.flush()
+
+        rotate_file_in_place(file.name, itemsize=8, tile_len=2)
+
+        file.seek(0)
+        elems = array('q', file.read()).tolist()
+
+    return [elems[row * side_len : (row + 1) * side_len]
+        for row in range(side_len)]
+
+
+# Maps a position `(row, col)` to `(row_offset + row_by_row * row +
+# row_by_col * col, col_offset + col_by_row * row + col_by_col * col)`.
+Transform = Tuple[int, int, int, int, int, int]
+
+IDENTITY_TRANSFORM: Transform = (0, 1, 0, 0, 0, 1)
+
+
+def compose_transforms(outer: Transform, inner: Transform) -> Transform:
+    """
+    Compose two position transforms, applying `inner` first then `outer`.
+    """
+
+    (row_offset, row_by_row, row_by_col, col_offset, col_by_row, col_by_col
+        ) = outer
+
+    (in_row_offset, in_row_by_row, in_row_by_col,
+        in_col_offset, in_col_by_row, in_col_by_col) = inner
+
+    return (
+        row_offset + row_by_row * in_row_offset + row_by_col * in_col_offset,
+        row_by_row * in_row_by_row + row_by_col * in_col_by_row,
+        row_by_row * in_row_by_col + row_by_col * in_col_by_col,
+        col_offset + col_by_row * in_row_offset + col_by_col * in_col_offset,
+        col_by_row * in_row_by_row + col_by_col * in_col_by_row,
+        col_by_row * in_row_by_col + col_by_col * in_col_by_col)
+
+
+class RotatedView:
+    """
+    Lazy rotated and/or transposed view of a (possibly rectangular) matrix.
+
+    Every rotation or transpose just composes one more position transform
+    into a single one, so a chain of them is O(1) each, and reading any
+    element is O(1) too. The matrix is only copied (or rearranged in place)
+    when materialized.
+    """
+
+    def __init__(
+            self,
+            matrix: List[List],
+            shape: Optional[Tuple[int, int]] = None,
+            transform: Transform = IDENTITY_TRANSFORM):
+
+        if shape is None:
+            shape = (len(matrix), len(matrix[0]) if matrix else 0)
+
+        self._matrix = matrix
+        self._shape = shape
+        self._transform = transform
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self._shape
+
+    def rotate(self, quarter_turns: int = 1) -> 'RotatedView':
+        """
+        Rotate by 90 degrees clockwise, `quarter_turns` times (negative for
+        counterclockwise).
+        """
+
+        view = self
+
+        for i in range(quarter_turns % 4):
+            (num_rows, num_cols) = view._shape
+
+            # Clockwise: `new[row][col] = old[num_rows - 1 - col][row]`.
+            view = view._compose(
+                (num_rows - 1, 0, -1, 0, 1, 0),
+                (num_cols, num_rows))
+
+        return view
+
+    def transpose(self) -> 'RotatedView':
+        (num_rows, num_cols) = self._shape
+        return self._compose((0, 0, 1, 0, 1, 0), (num_cols, num_rows))
+
+    def __getitem__(self, position: Tuple[int, int]) -> Any:
+        (row, col) = self._source_position(position)
+        return self._matrix[row][col]
+
+    def __setitem__(self, position: Tuple[int, int], value: Any) -> None:
+        (row, col) = self._source_position(position)
+        self._matrix[row][col] = value
+
+    def materialize(self, in_place: bool = False) -> List[List]:
+        """
+        Copy the view into a new matrix, or rearrange the underlying matrix
+        in place, which then resets the view to it. (Any other views of the
+        same matrix are then affected too.)
+
+        Time: O(n), where n=number of elements in matrix
+        Space: O(n) when copying, O(1) in place
+        """
+
+        if not in_place:
+            return [[self[row, col] for col in range(self._shape[1])]
+                for row in range(self._shape[0])]
+
+        matrix = self._matrix
+        (row_offset, row_by_row, row_by_col, col_offset, col_by_row,
+            col_by_col) = self._transform
+
+        # Either a row (or column) of the view comes from a row (or column)
+        # of the matrix, possibly reversed, or the view is also transposed.
+        is_transposed = row_by_row == 0
+
+        if is_transposed and matrix and (len(matrix) != len(matrix[0])):
+            raise ValueError('can only transpose square matrix in place')
+
+        if (row_by_row if not is_transposed else row_by_col) < 0:
+            matrix.reverse()
+
+        if (col_by_col if not is_transposed else col_by_row) < 0:
+            for row in matrix:
+                row.reverse()
+
+        if is_transposed:
+            for row in range(len(matrix)):
+                for col in range(row + 1, len(matrix)):
+                    (matrix[row][col], matrix[col][row]) = (
+                        matrix[col][row], matrix[row][col])
+
+        self._shape = (len(matrix), len(matrix[0]) if matrix else 0)
+        self._transform = IDENTITY_TRANSFORM
+        return matrix
+
+    def _compose(
+            self,
+            transform: Transform,
+            shape: Tuple[int, int]) -> 'RotatedView':
+
+        return RotatedView(
+            self._matrix,
+            shape,
+            compose_transforms(self._transform, transform))
+
+    def _source_position(self, position: Tuple[int, int]) -> Tuple[int, int]:
+        (row, col) = position
+
+        if not ((0 <= row < self._shape[0]) and (0 <= col < self._shape[1])):
+            raise IndexError(position)
+
+        (row_offset, row_by_row, row_by_col, col_offset, col_by_row,
+            col_by_col) = self._transform
+
+        return (
+            row_offset + row_by_row * row + row_by_col * col,
+            col_offset + col_by_row * row + col_by_col * col)
+
+
+def rotate_matrix_view(matrix: List[List]) -> List[List]:
+    return RotatedView(matrix).rotate().materialize()
+
+
+def rotate_matrix_view_in_place(matrix: List[List]) -> List[List]:
+    return RotatedView(matrix).rotate().materialize(in_place=True)
+
+
+def benchmark(side_lens: Tuple[int, ...] = (100, 1000, 2000)) -> None:
+    impls = [rotate_matrix, rotate_matrix_in_place, rotate_matrix_tiled]
+
+    for side_len in side_lens:
+        matrix = [list(range(row * side_len, (row + 1) * side_len))
+            for row in range(side_len)]
+
+        for rotate in impls:
+            seconds = timeit.timeit(lambda: rotate(matrix), number=1)
+            print('%6s %-24s %12.1f ms' % (
+                side_len, rotate.__name__, seconds * 1e3))
+
+
 class Test (unittest.TestCase):
     rotate_impls = {
         rotate_matrix,
         rotate_matrix_in_place,
+        rotate_matrix_tiled,
+        rotate_matrix_view,
+        rotate_matrix_view_in_place,
+        rotate_matrix_file,
     }
 
     def test_empty_matrix(self):
@@ -207,5 +576,137 @@ class Test (unittest.TestCase):
                     ])
 
 
+class TestTiled (unittest.TestCase):
+    def test_tile_lengths(self):
+        for side_len in range(12):
+            for tile_len in [1, 2, 3, 5, 64]:
+                with self.subTest(side_len=side_len, tile_len=tile_len):
+                    matrix = [
+                        list(range(row * side_len, (row + 1) * side_len))
+                        for row in range(side_len)]
+
+                    self.assertEqual(
+                        rotate_matrix_tiled(
+                            [list(row) for row in matrix], tile_len),
+                        rotate_matrix(matrix))
+
+
+class TestFile (unittest.TestCase):
+    def test_tile_lengths(self):
+        for side_len in range(9):
+            matrix = [list(range(row * side_len, (row + 1) * side_len))
+                for row in range(side_len)]
+
+            for (itemsize, tile_len) in [(1, 1), (2, 2), (4, 3), (8, 64)]:
+                with self.subTest(
+                        side_len=side_len,
+                        itemsize=itemsize,
+                        tile_len=tile_len):
+
+                    format = FORMAT_BY_ITEMSIZE[itemsize]
+
+                    with tempfile.NamedTemporaryFile() as file:
+                        file.write(array(format,
+                            [elem for row in matrix for elem in row]))
+                        file.flush()
+
+                        rotate_file_in_place(file.name, itemsize, tile_len)
+                        file.seek(0)
+
+                        self.assertEqual(
+                            array(format, file.read()).tolist(),
+                            [elem for row in rotate_matrix(matrix)
+                                for elem in row])
+
+    def test_invalid_file_size(self):
+        with tempfile.NamedTemporaryFile() as file:
+            file.write(bytes(6))
+            file.flush()
+
+            with self.assertRaises(ValueError):
+                rotate_file_in_place(file.name)
+
+            with self.assertRaises(ValueError):
+                rotate_file_in_place(file.name, itemsize=3)
+
+
+class TestRotatedView (unittest.TestCase):
+    def setUp(self):
+        self.matrix = [
+            [1, 2, 3],
+            [4, 5, 6],
+        ]
+
+    def test_rotations(self):
+        square = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+        for quarter_turns in range(-5, 9):
+            with self.subTest(quarter_turns=quarter_turns):
+                expected = square
+
+                for i in range(quarter_turns % 4):
+                    expected = rotate_matrix(expected)
+
+                view = RotatedView([list(row) for row in square])
+
+                for i in range(abs(quarter_turns)):
+                    view = view.rotate(1 if quarter_turns > 0 else -1)
+
+                self.assertEqual(view.materialize(), expected)
+                self.assertEqual(view.materialize(in_place=True), expected)
+
+    def test_rectangular_rotation(self):
+        view = RotatedView(self.matrix).rotate()
+
+        self.assertEqual(view.shape, (3, 2))
+        self.assertEqual(view.materialize(), [[4, 1], [5, 2], [6, 3]])
+        self.assertEqual(view.rotate(-1).materialize(), self.matrix)
+        self.assertEqual(
+            view.rotate().materialize(in_place=True),
+            [[6, 5, 4], [3, 2, 1]])
+
+    def test_transpose(self):
+        view = RotatedView(self.matrix).transpose()
+
+        self.assertEqual(view.shape, (3, 2))
+        self.assertEqual(view.materialize(), [[1, 4], [2, 5], [3, 6]])
+        self.assertEqual(view.transpose().materialize(), self.matrix)
+        self.assertEqual(
+            view.rotate().materialize(),
+            [[3, 2, 1], [6, 5, 4]])
+
+        with self.assertRaises(ValueError):
+            view.materialize(in_place=True)
+
+    def test_transpose_in_place(self):
+        square = [[1, 2], [3, 4]]
+
+        self.assertEqual(
+            RotatedView(square).rotate(-1).transpose().materialize(
+                in_place=True),
+            [[2, 1], [4, 3]])
+
+    def test_element_access(self):
+        view = RotatedView(self.matrix).rotate()
+
+        self.assertEqual(view[0, 0], 4)
+        self.assertEqual(view[2, 1], 3)
+
+        view[2, 1] = 30
+        self.assertEqual(self.matrix[0][2], 30)
+
+        with self.assertRaises(IndexError):
+            view[0, 2]
+
+        with self.assertRaises(IndexError):
+            view[-1, 0]
+
+
 if __name__ == '__main__':
-    unittest.main(verbosity=2)
+    if sys.argv[1:2] == ['--benchmark']:
+        if len(sys.argv) > 2:
+            benchmark(tuple(map(int, sys.argv[2:])))
+        else:
+            benchmark()
+    else:
+        unittest.main(verbosity=2)
@@ -34,8 +34,20 @@ Rules:
     the bonus throws are only used to calculate the score of the final turn.
 """
 
+from array import array
+import argparse
+import asyncio
+import collections
+import random
+import statistics
+import time
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 NUM_TURNS = 10
 NUM_PINS = 10
@@ -68,6 +80,10 @@ class NormalTurnType:
     def num_tries(self):
         return 2
 
+    @property
+    def num_next_tries_for_points(self):
+        return 0
+
     def __str__(self):
         return '<%s: tries=%s bonus=%s>' % (
           type(self).__name__,
@@ -88,10 +104,21 @@ class SpecialTurnType (NormalTurnType):
         self._points = points
 
     def is_of(self, turn):
-        num_pins_per_try = turn.num_pins_per_try
+        # Read the tries directly, without copying them, as it's called on
+        # every try.
+        num_pins_per_try = turn._num_pins_per_try
+
+        if len(num_pins_per_try) < self._num_tries:
+            return False
+
+        num_pins = 0
+        i = 0
 
-        return ((len(num_pins_per_try) >= self._num_tries)
-                and (sum(num_pins_per_try[:self._num_tries]) == NUM_PINS))
+        while i < self._num_tries:
+            num_pins += num_pins_per_try[i]
+            i += 1
+
+        return num_pins == NUM_PINS
 
     def score(self, turn, next_turns):
         next_tries = turn.num_pins_per_try[self._num_tries:]
@@ -111,6 +138,10 @@ class SpecialTurnType (NormalTurnType):
     def num_tries(self):
         return self._num_tries
 
+    @property
+    def num_next_tries_for_points(self):
+        return self._num_next_tries_for_points
+
 
 NORMAL_TURN_TYPE = NormalTurnType()
 
@@ -129,6 +160,17 @@ STRIKE_TURN_TYPE = SpecialTurnType(
     points = 10)
 
 
+# Turn types a normal turn can become, in order of precedence.
+SPECIAL_TURN_TYPES = (SPARE_TURN_TYPE, STRIKE_TURN_TYPE)
+
+
+# Maximum number of next tries any turn type can still be waiting on for
+# points, ie. how far ahead a strike/spare bonus can reach.
+MAX_NEXT_TRIES_FOR_POINTS = max(
+    turn_type.num_next_tries_for_points
+    for turn_type in (NORMAL_TURN_TYPE,) + SPECIAL_TURN_TYPES)
+
+
 class Turn:
     def __init__(self):
         self._num_pins_per_try = []
@@ -142,7 +184,7 @@ class Turn:
         self._num_pins_per_try.append(num_pins)
 
         if self._type is NORMAL_TURN_TYPE:
-            for turn_type in [SPARE_TURN_TYPE, STRIKE_TURN_TYPE]:
+            for turn_type in SPECIAL_TURN_TYPES:
                 if turn_type.is_of(self):
                     self._type = turn_type
                     break
@@ -179,18 +221,49 @@ class Turn:
     def try_num(self):
         return len(self._num_pins_per_try) + 1
 
+    @property
+    def type(self):
+        return self._type
+
 
 class Game:
+    """
+    Keeps a running score, updated on every try, so that scoring is O(1).
+
+    Each try adds its pins once to the score, plus once more for every
+    strike/spare still waiting on it for points. The pending bonuses are kept
+    as a fixed size queue of how many bonuses each of the next tries counts
+    towards, which is shifted by one on every try.
+
+    Adding a try doesn't copy any lists, nor does detecting strikes/spares
+    and when a turn ends through `Turn`. Only a new `Turn` is allocated per
+    turn. See `CompactGame` for a game without any per-turn objects.
+    """
+
     def __init__(self):
         self._turns = [Turn()]
+        self._score = 0
+        self._bonuses_per_next_try = MAX_NEXT_TRIES_FOR_POINTS * [0]
 
     def add_try(self, num_pins):
         if self.has_finished():
             raise GameHasFinishedError()
 
-        self._current_turn.add_try(num_pins)
+        turn = self._current_turn
+        turn_type = turn.type
+        turn.add_try(num_pins)
+        self._add_try_score(num_pins)
 
-        if self._current_turn.has_finished():
+        # Bonus tries of the last turn only count towards its own points,
+        # which are already accounted for as they're added.
+        if (turn.type is not turn_type) and (self.turn_num < NUM_TURNS):
+            i = 0
+
+            while i < turn.type.num_next_tries_for_points:
+                self._bonuses_per_next_try[i] += 1
+                i += 1
+
+        if turn.has_finished():
             if self.turn_num >= NUM_TURNS:
                 self._current_turn.enable_bonus()
             else:
@@ -201,14 +274,24 @@ class Game:
             and self._current_turn.has_finished())
 
     def score(self):
-        tally = 0
-        turns = list(self._turns)
+        """
+        Time: O(1)
+        Space: O(1)
+        """
+
+        return self._score
 
-        while turns:
-            turn = turns.pop(0)
-            tally += turn.score(turns)
+    def _add_try_score(self, num_pins):
+        bonuses_per_next_try = self._bonuses_per_next_try
+        self._score += num_pins * (1 + bonuses_per_next_try[0])
 
-        return tally
+        i = 1
+
+        while i < len(bonuses_per_next_try):
+            bonuses_per_next_try[i - 1] = bonuses_per_next_try[i]
+            i += 1
+
+        bonuses_per_next_try[-1] = 0
 
     @property
     def _current_turn(self):
@@ -223,6 +306,191 @@ class Game:
         return len(self._turns)
 
 
+class CompactGame:
+    """
+    Same as `Game`, but keeps the whole game state in a fixed number of
+    slotted integers instead of a list of `Turn` objects: the current turn
+    number, the number of tries taken and allowed in it, the pins knocked
+    down on its first try (to detect a spare), the running score, and the
+    number of pending strike/spare bonuses for each of the next two tries.
+
+    Time: O(1) per try
+    Space: O(1)
+    """
+
+    __slots__ = (
+        '_turn_num',
+        '_num_turn_tries',
+        '_max_turn_tries',
+        '_first_num_pins',
+        '_score',
+        '_next_try_bonuses',
+        '_next_next_try_bonuses',
+    )
+
+    def __init__(self):
+        self._turn_num = 1
+        self._num_turn_tries = 0
+        self._max_turn_tries = NORMAL_TURN_TYPE.num_tries
+        self._first_num_pins = 0
+        self._score = 0
+        self._next_try_bonuses = 0
+        self._next_next_try_bonuses = 0
+
+    def add_try(self, num_pins):
+        if self.has_finished():
+            raise GameHasFinishedError()
+
+        self._score += num_pins * (1 + self._next_try_bonuses)
+        self._next_try_bonuses = self._next_next_try_bonuses
+        self._next_next_try_bonuses = 0
+        self._num_turn_tries += 1
+
+        # Only a normal turn can still become a strike or a spare, and it's
+        # the only kind of turn that doesn't allow bonus tries.
+        if self._max_turn_tries == NORMAL_TURN_TYPE.num_tries:
+            if self._num_turn_tries == 1:
+                self._first_num_pins = num_pins
+                is_strike = num_pins == NUM_PINS
+                is_spare = False
+            else:
+                is_strike = False
+                is_spare = self._first_num_pins + num_pins == NUM_PINS
+
+            if is_strike or is_spare:
+                turn_type = STRIKE_TURN_TYPE if is_strike else SPARE_TURN_TYPE
+
+                if self._turn_num >= NUM_TURNS:
+                    self._max_turn_tries = (
+                        turn_type.num_tries + turn_type.num_bonus_tries)
+                else:
+                    self._next_try_bonuses += 1
+
+                    if turn_type.num_next_tries_for_points > 1:
+                        self._next_next_try_bonuses += 1
+
+                    self._start_next_turn()
+                    return
+
+        if ((self._num_turn_tries >= self._max_turn_tries)
+                and (self._turn_num < NUM_TURNS)):
+            self._start_next_turn()
+
+    def has_finished(self):
+        return ((self._turn_num >= NUM_TURNS)
+            and (self._num_turn_tries >= self._max_turn_tries))
+
+    def score(self):
+        return self._score
+
+    def _start_next_turn(self):
+        self._turn_num += 1
+        self._num_turn_tries = 0
+        self._max_turn_tries = NORMAL_TURN_TYPE.num_tries
+
+    @property
+    def try_num(self):
+        return self._num_turn_tries + 1
+
+    @property
+    def turn_num(self):
+        return self._turn_num
+
+
+def score_games_simple(tries, offsets):
+    """
+    Score many games at once, given all their tries concatenated in one flat
+    sequence, and the offsets where each game starts plus the final end
+    offset (ie. game `i` is `tries[offsets[i]:offsets[i + 1]]`).
+
+    Games are scored in place from the tries, turn by turn, without building
+    any `Game` or `Turn` objects. Incomplete games are scored the same way as
+    `Game.score()` does, with missing tries counting as zero.
+
+    Time: O(n), where n=total number of tries
+    Space: O(g), where g=number of games
+    """
+
+    scores = array('i', bytes(array('i').itemsize * (len(offsets) - 1)))
+
+    for game in range(len(offsets) - 1):
+        pos = offsets[game]
+        end = offsets[game + 1]
+        score = 0
+
+        for turn_num in range(NUM_TURNS):
+            if pos >= end:
+                break
+
+            first = tries[pos]
+            second = tries[pos + 1] if pos + 1 < end else 0
+            score += first + second
+
+            if (first == NUM_PINS) or (first + second == NUM_PINS):
+                score += tries[pos + 2] if pos + 2 < end else 0
+
+            pos += 1 if first == NUM_PINS else 2
+
+        scores[game] = score
+
+    return scores
+
+
+def score_games_numpy(tries, offsets):
+    """
+    Same as `score_games_simple`, but vectorized with NumPy across all games:
+    each turn is scored for every game at once, with frame boundaries and
+    strike/spare bonuses found by indexing all the tries at the current
+    position of each game.
+
+    Time: O(n), where n=total number of tries
+    Space: O(g), where g=number of games
+    """
+
+    tries = numpy.asarray(tries)
+    offsets = numpy.asarray(offsets, dtype = numpy.intp)
+    pos = offsets[:-1].copy()
+    end = offsets[1:]
+    scores = numpy.zeros(len(pos), dtype = numpy.int32)
+
+    if len(tries) == 0:
+        return scores
+
+    last_pos = len(tries) - 1
+
+    # Tries past the end of a game count as zero, which also avoids having
+    # to pad the tries array to read past the end of the last game.
+    def take(pos):
+        return numpy.where(
+            pos < end,
+            tries.take(numpy.minimum(pos, last_pos)),
+            0)
+
+    for turn_num in range(NUM_TURNS):
+        first = take(pos)
+        second = take(pos + 1)
+        is_strike = first == NUM_PINS
+        has_bonus = is_strike | (first + second == NUM_PINS)
+
+        scores += first + second + numpy.where(has_bonus, take(pos + 2), 0)
+        pos += numpy.where(is_strike, 1, 2)
+
+    return scores
+
+
+def score_games(tries, offsets):
+    """
+    Score many games at once, using NumPy when it's available.
+
+    See `score_games_simple` for the input format.
+    """
+
+    if numpy is None:
+        return score_games_simple(tries, offsets)
+    else:
+        return score_games_numpy(tries, offsets)
+
+
 def read_input_num_pins():
     num_pins = None
 
@@ -241,6 +509,252 @@ def read_input_num_pins():
     return num_pins
 
 
+class LaneScoreServer:
+    """
+    Live scoring of many lanes at once, with one `Game` per lane, over a
+    line based protocol. Each line received is a try for a lane:
+
+        <lane> <num. pins>
+
+    And each line sent back is the lane's updated score, along with the
+    turn/try numbers of its next try, or `done` when its game has finished
+    (in which case the lane's next try starts a new game):
+
+        <lane> <score> <turn num.> <try num.>
+        <lane> <score> done
+
+    Or on error:
+
+        <lane> error <reason>
+
+    The handling time of a try is measured in-process, from the line being
+    read to its reply being queued for sending, so it excludes the network
+    round trip (see `generate_load` for that).
+    """
+
+    def __init__(self):
+        self.games = {}
+        self.num_tries = 0
+
+        # Stats since the last report.
+        self.interval_start_time = time.perf_counter()
+        self.interval_num_tries = 0
+        self.interval_handling_time = 0.0
+        self.max_handling_time = 0.0
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+
+                if not line:
+                    break
+
+                start = time.perf_counter()
+
+                try:
+                    reply = self.handle_line(line.decode())
+                except UnicodeDecodeError:
+                    fields = line.decode(errors = 'replace').split()
+                    reply = '%s error invalid-line' % (
+                        fields[0] if fields else '-')
+
+                writer.write(reply.encode() + b'\n')
+                handling_time = time.perf_counter() - start
+
+                self.interval_handling_time += handling_time
+                self.max_handling_time = max(
+                    self.max_handling_time, handling_time)
+
+                await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    def handle_line(self, line):
+        fields = line.split()
+
+        if len(fields) != 2:
+            return '%s error invalid-line' % (fields[0] if fields else '-')
+
+        (lane, num_pins) = fields
+
+        try:
+            num_pins = int(num_pins, base = 10)
+        except ValueError:
+            num_pins = None
+
+        if (num_pins is None) or (num_pins < 0) or (num_pins > NUM_PINS):
+            return '%s error invalid-num-pins' % lane
+
+        game = self.games.get(lane)
+
+        if (game is None) or game.has_finished():
+            game = self.games[lane] = Game()
+
+        game.add_try(num_pins)
+        self.num_tries += 1
+
+        if game.has_finished():
+            return '%s %s done' % (lane, game.score())
+        else:
+            return '%s %s %s %s' % (
+                lane, game.score(), game.turn_num, game.try_num)
+
+    def format_stats(self):
+        """
+        Format the tries/s and handling time since the last report (or
+        since starting), then start a new interval.
+        """
+
+        now = time.perf_counter()
+        num_tries = self.num_tries - self.interval_num_tries
+        mean_handling_time = self.interval_handling_time / max(num_tries, 1)
+
+        stats = ('lanes=%s tries=%s tries/s=%.0f'
+                ' handling(us): mean=%.1f max=%.1f') % (
+            len(self.games),
+            self.num_tries,
+            num_tries / (now - self.interval_start_time),
+            mean_handling_time * 1e6,
+            self.max_handling_time * 1e6)
+
+        self.interval_start_time = now
+        self.interval_num_tries = self.num_tries
+        self.interval_handling_time = 0.0
+        self.max_handling_time = 0.0
+
+        return stats
+
+    async def serve(self, host, port, report_interval = None):
+        server = await asyncio.start_server(
+            self.handle_connection, host, port)
+
+        async with server:
+            (host, port) = server.sockets[0].getsockname()[:2]
+            print('Serving on %s:%s' % (host, port))
+
+            if report_interval is None:
+                await server.serve_forever()
+            else:
+                serve_task = asyncio.create_task(server.serve_forever())
+
+                try:
+                    while True:
+                        await asyncio.sleep(report_interval)
+                        print(self.format_stats())
+                finally:
+                    serve_task.cancel()
+
+
+LoadReport = collections.namedtuple('LoadReport',
+    ['num_tries', 'elapsed', 'latencies', 'scores'])
+
+
+async def generate_load(host, port, num_lanes, num_games, seed = None):
+    """
+    Play `num_games` random games on each of `num_lanes` lanes at once,
+    with one connection per lane to a `LaneScoreServer`, measuring the
+    round-trip latency of every try.
+
+    Each lane gets its own random generator seeded with `seed + lane`, so
+    that the games played are reproducible when a seed is given.
+    """
+
+    async def play_lane(lane):
+        rand = random.Random(None if seed is None else seed + lane)
+        (reader, writer) = await asyncio.open_connection(host, port)
+        latencies = []
+        scores = []
+
+        try:
+            for i in range(num_games):
+                for num_pins in make_random_tries(rand):
+                    start = time.perf_counter()
+                    writer.write(b'%d %d\n' % (lane, num_pins))
+                    await writer.drain()
+                    reply = (await reader.readline()).decode().split()
+                    latencies.append(time.perf_counter() - start)
+
+                    if reply[-1] == 'done':
+                        scores.append(int(reply[1]))
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+        return (latencies, scores)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*map(play_lane, range(num_lanes)))
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for (lane_latencies, _) in results
+        for latency in lane_latencies]
+
+    return LoadReport(
+        num_tries = len(latencies),
+        elapsed = elapsed,
+        latencies = latencies,
+        scores = [lane_scores for (_, lane_scores) in results])
+
+
+def format_load_report(report):
+    if len(report.latencies) >= 2:
+        percentiles = statistics.quantiles(report.latencies, n = 100)
+    else:
+        percentiles = 99 * [report.latencies[0] if report.latencies else 0]
+
+    return ('tries=%s tries/s=%.0f'
+            ' latency(us): p50=%.1f p99=%.1f max=%.1f') % (
+        report.num_tries,
+        report.num_tries / report.elapsed,
+        percentiles[49] * 1e6,
+        percentiles[98] * 1e6,
+        max(report.latencies, default = 0) * 1e6)
+
+
+def make_random_tries(rand = random):
+    """
+    Generate a random valid sequence of tries for a whole game.
+    """
+
+    tries = []
+
+    for turn_num in range(1, NUM_TURNS + 1):
+        first = rand.randint(0, NUM_PINS)
+        tries.append(first)
+
+        if first == NUM_PINS:
+            if turn_num == NUM_TURNS:
+                bonus = rand.randint(0, NUM_PINS)
+                tries.append(bonus)
+                tries.append(rand.randint(0,
+                    NUM_PINS if bonus == NUM_PINS else NUM_PINS - bonus))
+        else:
+            second = rand.randint(0, NUM_PINS - first)
+            tries.append(second)
+
+            if (turn_num == NUM_TURNS) and (first + second == NUM_PINS):
+                tries.append(rand.randint(0, NUM_PINS))
+
+    return tries
+
+
+def tally_turns(turns):
+    """
+    Score a game from scratch, by scoring each turn with the turns after it.
+    """
+
+    tally = 0
+    turns = list(turns)
+
+    while turns:
+        turn = turns.pop(0)
+        tally += turn.score(turns)
+
+    return tally
+
+
 class TestFunctional (unittest.TestCase):
     def setUp(self):
         self.game = Game()
@@ -268,6 +782,223 @@ class TestFunctional (unittest.TestCase):
         self.assertEqual(self.game.score(), 300)
 
 
+class TestIncrementalScore (unittest.TestCase):
+    def assertScoresMatchTurns(self, tries):
+        game = Game()
+
+        for num_pins in tries:
+            game.add_try(num_pins)
+            self.assertEqual(game.score(), tally_turns(game._turns))
+
+        self.assertTrue(game.has_finished())
+
+    def test_spare_after_strike(self):
+        self.assertScoresMatchTurns([10, 3, 7, 10, 10, 0, 10] + 5 * [1, 2])
+
+    def test_last_turn_strike_after_strikes(self):
+        self.assertScoresMatchTurns(9 * [0, 0] + [10, 10, 10])
+        self.assertScoresMatchTurns(8 * [0, 0] + [10, 10, 3, 4])
+
+    def test_last_turn_spare_after_strike(self):
+        self.assertScoresMatchTurns(8 * [0, 0] + [10, 0, 10, 10])
+
+    def test_random_games(self):
+        rand = random.Random(0)
+
+        for i in range(500):
+            tries = make_random_tries(rand)
+
+            with self.subTest(tries = tries):
+                self.assertScoresMatchTurns(tries)
+
+
+class TestCompactGame (unittest.TestCase):
+    def assertMatchesGame(self, tries):
+        game = Game()
+        compact_game = CompactGame()
+
+        for num_pins in tries:
+            game.add_try(num_pins)
+            compact_game.add_try(num_pins)
+
+            self.assertEqual(compact_game.score(), game.score())
+            self.assertEqual(compact_game.turn_num, game.turn_num)
+            self.assertEqual(compact_game.try_num, game.try_num)
+            self.assertEqual(
+                compact_game.has_finished(),
+                game.has_finished())
+
+        self.assertTrue(compact_game.has_finished())
+
+        with self.assertRaises(GameHasFinishedError):
+            compact_game.add_try(0)
+
+    def test_functional_games(self):
+        for tries in [10 * [9, 0], 10 * [5, 5] + [5], 12 * [10]]:
+            with self.subTest(tries = tries):
+                self.assertMatchesGame(tries)
+
+    def test_last_turn_bonus(self):
+        self.assertMatchesGame(9 * [0, 0] + [10, 0, 10])
+        self.assertMatchesGame(9 * [0, 0] + [0, 10, 10])
+        self.assertMatchesGame(8 * [0, 0] + [10, 10, 3, 4])
+
+    def test_random_games(self):
+        rand = random.Random(0)
+
+        for i in range(500):
+            tries = make_random_tries(rand)
+
+            with self.subTest(tries = tries):
+                self.assertMatchesGame(tries)
+
+
+class TestScoreGames (unittest.TestCase):
+    score_games_impls = {score_games_simple}
+
+    if numpy is not None:
+        score_games_impls.add(score_games_numpy)
+
+    def assertScoresMatchGames(self, games):
+        tries = array('B')
+        offsets = array('l', [0])
+        expected_scores = []
+
+        for game_tries in games:
+            game = Game()
+
+            for num_pins in game_tries:
+                game.add_try(num_pins)
+
+            tries.extend(game_tries)
+            offsets.append(len(tries))
+            expected_scores.append(game.score())
+
+        for score_games in self.score_games_impls:
+            with self.subTest(score_games):
+                self.assertEqual(
+                    list(score_games(tries, offsets)),
+                    expected_scores)
+
+    def test_no_games(self):
+        self.assertScoresMatchGames([])
+
+    def test_functional_games(self):
+        self.assertScoresMatchGames([
+            10 * [9, 0],
+            10 * [5, 5] + [5],
+            12 * [10],
+        ])
+
+    def test_incomplete_games(self):
+        self.assertScoresMatchGames([
+            [],
+            [10],
+            [7, 3],
+            [10, 10, 4],
+            9 * [0, 0] + [10],
+        ])
+
+    def test_random_games(self):
+        rand = random.Random(0)
+        self.assertScoresMatchGames(
+            [make_random_tries(rand) for i in range(1000)])
+
+
+class TestLaneScoreServer (unittest.TestCase):
+    def setUp(self):
+        self.server = LaneScoreServer()
+
+    def test_lanes_are_independent(self):
+        self.assertEqual(self.server.handle_line('1 10\n'), '1 10 2 1')
+        self.assertEqual(self.server.handle_line('2 3\n'), '2 3 1 2')
+        self.assertEqual(self.server.handle_line('1 4\n'), '1 18 2 2')
+        self.assertEqual(self.server.num_tries, 3)
+
+    def test_game_done_starts_new_game(self):
+        for num_pins in 11 * [10]:
+            self.server.handle_line('a %s' % num_pins)
+
+        self.assertEqual(self.server.handle_line('a 10'), 'a 300 done')
+        self.assertEqual(self.server.handle_line('a 1'), 'a 1 1 2')
+
+    def test_invalid_lines(self):
+        self.assertEqual(self.server.handle_line(''), '- error invalid-line')
+        self.assertEqual(
+            self.server.handle_line('a 1 2'),
+            'a error invalid-line')
+        self.assertEqual(
+            self.server.handle_line('a 11'),
+            'a error invalid-num-pins')
+        self.assertEqual(
+            self.server.handle_line('a x'),
+            'a error invalid-num-pins')
+        self.assertEqual(self.server.num_tries, 0)
+
+    def test_invalid_encoding(self):
+        async def send_lines(lines):
+            server = await asyncio.start_server(
+                self.server.handle_connection, '127.0.0.1', 0)
+
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                (reader, writer) = await asyncio.open_connection(
+                    '127.0.0.1', port)
+
+                replies = []
+
+                for line in lines:
+                    writer.write(line)
+                    replies.append((await reader.readline()).decode())
+
+                writer.close()
+                await writer.wait_closed()
+                return replies
+
+        self.assertEqual(
+            asyncio.run(send_lines([b'a \xff\n', b'a 1\n'])),
+            ['a error invalid-line\n', 'a 1 1 2\n'])
+
+    def test_stats_per_interval(self):
+        self.server.handle_line('a 1')
+        self.server.max_handling_time = 1e-3
+
+        self.assertIn('tries=1 ', self.server.format_stats())
+        self.assertRegex(
+            self.server.format_stats(),
+            r'tries=1 tries/s=0 handling\(us\): mean=0.0 max=0.0$')
+
+    def test_load(self):
+        async def run_load():
+            server = await asyncio.start_server(
+                self.server.handle_connection, '127.0.0.1', 0)
+
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                return await generate_load(
+                    '127.0.0.1', port, num_lanes = 5, num_games = 3, seed = 0)
+
+        report = asyncio.run(run_load())
+
+        for lane in range(5):
+            rand = random.Random(lane)
+            scores = []
+
+            for i in range(3):
+                game = Game()
+
+                for num_pins in make_random_tries(rand):
+                    game.add_try(num_pins)
+
+                scores.append(game.score())
+
+            self.assertEqual(report.scores[lane], scores)
+
+        self.assertEqual(report.num_tries, self.server.num_tries)
+        self.assertIn('tries=%s ' % report.num_tries,
+            format_load_report(report))
+
+
 class TestTurn (unittest.TestCase):
     def new_spare_turn(self):
         turn = Turn()
@@ -356,7 +1087,7 @@ class TestTurn (unittest.TestCase):
                     next_turns)))
 
 
-if __name__ == '__main__':
+def play_interactive():
     game = Game()
 
     while not game.has_finished():
@@ -365,3 +1096,36 @@ if __name__ == '__main__':
         print()
 
     print('Score:', game.score())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = __doc__.split('\n')[1])
+    subparsers = parser.add_subparsers(dest = 'mode')
+
+    serve_parser = subparsers.add_parser('serve',
+        help = 'live scoring server for many lanes')
+    serve_parser.add_argument('--host', default = '127.0.0.1')
+    serve_parser.add_argument('--port', type = int, default = 9010)
+    serve_parser.add_argument('--report-interval', type = float, default = 5,
+        help = 'seconds between throughput/handling time reports')
+
+    load_parser = subparsers.add_parser('load',
+        help = 'load generator client for the scoring server')
+    load_parser.add_argument('--host', default = '127.0.0.1')
+    load_parser.add_argument('--port', type = int, default = 9010)
+    load_parser.add_argument('--lanes', type = int, default = 100)
+    load_parser.add_argument('--games', type = int, default = 10)
+
+    args = parser.parse_args()
+
+    if args.mode == 'serve':
+        try:
+            asyncio.run(LaneScoreServer().serve(
+                args.host, args.port, args.report_interval))
+        except KeyboardInterrupt:
+            pass
+    elif args.mode == 'load':
+        print(format_load_report(asyncio.run(generate_load(
+            args.host, args.port, args.lanes, args.games))))
+    else:
+        play_interactive()
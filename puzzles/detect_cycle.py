@@ -5,8 +5,21 @@
 Check if a linked list has a cycle, and where if it has one.
 """
 
+from array import array
+import collections
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# No successor, in a successor array.
+NO_NODE = -1
+
+FunctionalCycles = collections.namedtuple('FunctionalCycles',
+    ['cycles', 'entry', 'tail_len'])
+
 class Node:
     def __init__(self, value, nxt = None):
         self.value = value
@@ -36,15 +49,33 @@ def print_list(l):
     while True:
         print(l.value, end ='')
 
-        if l.next:
+        if l.nxt:
             print(', ', end = '')
-            l = l.next
+            l = l.nxt
         else:
             break
 
     print()
 
-def has_cycle(l):
+def step_node(node):
+    return None if node is None else node.nxt
+
+class StepCounter:
+    """
+    Step function that counts how many `nxt` pointers are followed.
+    """
+
+    def __init__(self):
+        self.num_steps = 0
+
+    def __call__(self, node):
+        if node is None:
+            return None
+
+        self.num_steps += 1
+        return node.nxt
+
+def has_cycle(l, step = step_node):
     """
     Returns `(has_cycle, cycle start node, previous node)`.
 
@@ -87,9 +118,6 @@ def has_cycle(l):
       length
     """
 
-    def step(node):
-        return None if node is None else node.next
-
     slow = l
     fast = l
     previous = None
@@ -114,6 +142,165 @@ def has_cycle(l):
 
     return (True, slow, previous)
 
+def has_cycle_brent(l, step = step_node):
+    """
+    Returns `(has_cycle, cycle start node, previous node, cycle length)`.
+
+    Time: O(n)
+    Space: O(1)
+
+    Brent's algorithm:
+
+    1. Keep two pointers: `hare` steps one node at a time, and `tortoise`
+       teleports to `hare` every time the number of steps taken since the
+       last teleport reaches a power of two
+    2. If they ever meet, then there's a cycle, and the number of steps taken
+       since the last teleport is its length `l`
+    3. Otherwise, there's no cycle
+
+    To find the start of the cycle:
+
+    1. Reset both to the start, and step `hare` `l` nodes ahead.
+    2. Step both now one node at a time.
+    3. The node where they meet is the start of the cycle.
+
+    Compared to Floyd's, each step moves only one pointer, and the cycle is
+    detected after a number of steps closer to the distance to the cycle plus
+    its length.
+    """
+
+    if l is None:
+        return (False, None, None, 0)
+
+    power = 1
+    length = 1
+    tortoise = l
+    hare = step(l)
+
+    while hare is not tortoise:
+        if hare is None:
+            return (False, None, None, 0)
+
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+
+        hare = step(hare)
+        length += 1
+
+    previous = None
+    hare = l
+
+    for i in range(length):
+        previous = hare
+        hare = step(hare)
+
+    tortoise = l
+
+    while tortoise is not hare:
+        tortoise = step(tortoise)
+        previous = hare
+        hare = step(hare)
+
+    return (True, tortoise, previous, length)
+
+def find_cycles(successors):
+    """
+    Find every cycle in a functional graph given as a successor array, where
+    `successors[i]` is the index of the node after node `i`, or `NO_NODE`.
+
+    Returns `FunctionalCycles(cycles, entry, tail_len)`:
+
+    - `cycles`: list of `(start node, cycle length)`, one per cycle
+    - `entry`: array of the first cycle node reached from each node (itself
+      if it's on a cycle), or `NO_NODE` if none is ever reached
+    - `tail_len`: array of the number of steps from each node to its entry
+      node, or `NO_NODE` if none is ever reached
+
+    Time: O(n)
+    Space: O(n), in arrays of machine integers (no objects per node)
+
+    Each unvisited node starts a walk that stamps every node on its way with
+    the walk's root, until it reaches a node already stamped. If it's stamped
+    by the same walk, then it's the start of a new cycle. Otherwise, it's
+    either the end of the path, or a node whose entry and tail length are
+    already known. A second walk then fills them in for the new tail nodes.
+    """
+
+    try:
+        successors = memoryview(successors)
+    except TypeError:
+        pass
+
+    num_nodes = len(successors)
+    typecode = 'i' if num_nodes < 2**31 else 'q'
+
+    walk = array(typecode, [NO_NODE]) * num_nodes
+    entry = array(typecode, [NO_NODE]) * num_nodes
+    tail_len = array(typecode, [NO_NODE]) * num_nodes
+    cycles = []
+
+    for root in range(num_nodes):
+        if walk[root] != NO_NODE:
+            continue
+
+        node = root
+        num_steps = 0
+
+        while (node != NO_NODE) and (walk[node] == NO_NODE):
+            walk[node] = root
+            node = successors[node]
+            num_steps += 1
+
+        if (node != NO_NODE) and (walk[node] == root):
+            start = node
+            length = 0
+
+            while True:
+                entry[node] = node
+                tail_len[node] = 0
+                node = successors[node]
+                length += 1
+
+                if node == start:
+                    break
+
+            cycles.append((start, length))
+            num_steps -= length
+
+        if (node == NO_NODE) or (tail_len[node] == NO_NODE):
+            continue
+
+        target = node
+        node = root
+
+        for i in range(num_steps):
+            entry[node] = entry[target]
+            tail_len[node] = num_steps - i + tail_len[target]
+            node = successors[node]
+
+    return FunctionalCycles(cycles, entry, tail_len)
+
+def make_cycle_list(tail_len, cycle_len):
+    """
+    Returns `(first node, cycle start node, last node)` of a list with a
+    cycle, after `tail_len` nodes before it.
+    """
+
+    l = make_list(*range(tail_len + cycle_len))
+    start = l
+    last = l
+
+    for i in range(tail_len):
+        start = start.nxt
+
+    while last.nxt is not None:
+        last = last.nxt
+
+    last.nxt = start
+    return (l, start, last)
+
 class Test (unittest.TestCase):
     def test_empty_list(self):
         self.assertEqual(
@@ -142,16 +329,116 @@ class Test (unittest.TestCase):
 
     def test_cycle_with_multiple_nodes(self):
         l = make_list('a', 'b', 'c')
-        c = l.nxt.next
+        c = l.nxt.nxt
 
-        c.next = l
+        c.nxt = l
         self.assertEqual(has_cycle(l), (True, l, c))
 
-        c.next = l.nxt
+        c.nxt = l.nxt
         self.assertEqual(has_cycle(l), (True, l.nxt, c))
 
-        c.next = l.nxt.next
-        self.assertEqual(has_cycle(l), (True, l.nxt.next, c))
+        c.nxt = l.nxt.nxt
+        self.assertEqual(has_cycle(l), (True, l.nxt.nxt, c))
+
+class TestBrent (unittest.TestCase):
+    def test_no_cycle(self):
+        for values in [(), ('a',), ('a', 'b', 'c')]:
+            with self.subTest(values = values):
+                self.assertEqual(
+                    has_cycle_brent(make_list(*values)),
+                    (False, None, None, 0))
+
+    def test_cycle_with_single_node(self):
+        l = make_list('x')
+        l.nxt = l
+        self.assertEqual(has_cycle_brent(l), (True, l, l, 1))
+
+    def test_same_as_floyd(self):
+        for tail_len in range(8):
+            for cycle_len in range(1, 8):
+                with self.subTest(tail_len = tail_len, cycle_len = cycle_len):
+                    (l, start, last) = make_cycle_list(tail_len, cycle_len)
+
+                    self.assertEqual(has_cycle(l), (True, start, last))
+                    self.assertEqual(
+                        has_cycle_brent(l),
+                        (True, start, last, cycle_len))
+
+    def test_num_steps(self):
+        for (tail_len, cycle_len) in [(1000, 3), (3, 1000), (500, 500)]:
+            with self.subTest(tail_len = tail_len, cycle_len = cycle_len):
+                (l, start, last) = make_cycle_list(tail_len, cycle_len)
+                floyd_steps = StepCounter()
+                brent_steps = StepCounter()
+
+                self.assertEqual(
+                    has_cycle(l, floyd_steps),
+                    (True, start, last))
+
+                self.assertEqual(
+                    has_cycle_brent(l, brent_steps),
+                    (True, start, last, cycle_len))
+
+                # Both have to step through every node at least once.
+                for steps in floyd_steps, brent_steps:
+                    self.assertGreaterEqual(
+                        steps.num_steps,
+                        tail_len + cycle_len)
+
+    def test_fewer_steps_long_tail(self):
+        (l, start, last) = make_cycle_list(1000, 3)
+        floyd_steps = StepCounter()
+        brent_steps = StepCounter()
+
+        has_cycle(l, floyd_steps)
+        has_cycle_brent(l, brent_steps)
+
+        self.assertLess(brent_steps.num_steps, floyd_steps.num_steps)
+
+class TestFindCycles (unittest.TestCase):
+    def test_empty(self):
+        result = find_cycles(array('l'))
+
+        self.assertEqual(result.cycles, [])
+        self.assertEqual(list(result.entry), [])
+
+    def test_no_cycles(self):
+        result = find_cycles(array('l', [1, 2, NO_NODE, 2]))
+
+        self.assertEqual(result.cycles, [])
+        self.assertEqual(list(result.entry), 4 * [NO_NODE])
+        self.assertEqual(list(result.tail_len), 4 * [NO_NODE])
+
+    def test_cycles_and_tails(self):
+        # 0 -> 1 -> 2 -> 3 -> 1, 4 -> 4, 5 -> 2, 6 -> 5, 7 -> 8 -> end
+        result = find_cycles(array('l', [1, 2, 3, 1, 4, 2, 5, 8, NO_NODE]))
+
+        self.assertEqual(result.cycles, [(1, 3), (4, 1)])
+        self.assertEqual(
+            list(result.entry),
+            [1, 1, 2, 3, 4, 2, 2, NO_NODE, NO_NODE])
+        self.assertEqual(
+            list(result.tail_len),
+            [1, 0, 0, 0, 0, 1, 2, NO_NODE, NO_NODE])
+
+    def test_same_as_linked_list(self):
+        for tail_len in range(6):
+            for cycle_len in range(1, 6):
+                with self.subTest(tail_len = tail_len, cycle_len = cycle_len):
+                    num_nodes = tail_len + cycle_len
+                    successors = list(range(1, num_nodes)) + [tail_len]
+                    result = find_cycles(successors)
+
+                    self.assertEqual(result.cycles, [(tail_len, cycle_len)])
+                    self.assertEqual(result.tail_len[0], tail_len)
+                    self.assertEqual(result.entry[0], tail_len)
+
+    @unittest.skipIf(numpy is None, 'NumPy not available')
+    def test_numpy_successors(self):
+        result = find_cycles(numpy.array([1, 0, 0, 2]))
+
+        self.assertEqual(result.cycles, [(0, 2)])
+        self.assertEqual(list(result.tail_len), [0, 0, 1, 2])
 
 if __name__ == '__main__':
     unittest.main(verbosity = 2)
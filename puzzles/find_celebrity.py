@@ -12,11 +12,19 @@ starting with zero `0`.
 """
 
 from functools import partial
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import collections
+import random
+import time
 import unittest
 
 
 KnowsFunction = Callable[[int, int], bool]
+KnowsManyFunction = Callable[[List[Tuple[int, int]]], List[bool]]
+
+
+# Default max. number of answers kept by `CachedKnows`.
+DEFAULT_CACHE_SIZE = 64 * 1024
 
 
 def find_celebrity_simple(
@@ -87,6 +95,237 @@ def find_celebrity_memory(
     return None
 
 
+def find_celebrity_elimination(
+        people: List[int],
+        knows: KnowsFunction) -> Optional[int]:
+
+    """
+    Eliminate one person per question: if the candidate knows someone, then
+    the candidate isn't a celebrity, otherwise the other person isn't. The
+    last candidate standing is then verified against everyone else, except
+    for the questions already asked while eliminating (ie. whether the
+    candidate knows anyone after it).
+
+    Time: O(n), at most 3(n-1) questions
+    Space: O(1)
+    """
+
+    if len(people) <= 1:
+        return None
+
+    candidate_pos = 0
+
+    for pos in range(1, len(people)):
+        if knows(people[candidate_pos], people[pos]):
+            candidate_pos = pos
+
+    candidate = people[candidate_pos]
+    prefetch = getattr(knows, 'prefetch', None)
+
+    # Ask all verification questions in bulk upfront, if possible.
+    if prefetch is not None:
+        prefetch(
+            [(candidate, other) for other in people[:candidate_pos]]
+            + [(other, candidate)
+                for (pos, other) in enumerate(people) if pos != candidate_pos])
+
+    for pos, other in enumerate(people):
+        if pos == candidate_pos:
+            continue
+
+        if (pos < candidate_pos) and knows(candidate, other):
+            return None
+
+        if not knows(other, candidate):
+            return None
+
+    return candidate
+
+
+class CountingKnows:
+    """
+    Wraps a knows function to count how many questions are asked.
+    """
+
+    def __init__(self, knows: KnowsFunction):
+        self.knows = knows
+        self.num_calls = 0
+
+    def __call__(self, person_1: int, person_2: int) -> bool:
+        self.num_calls += 1
+        return self.knows(person_1, person_2)
+
+
+class CachedKnows:
+    """
+    Wraps an expensive knows function to remember answers, up to a max.
+    number of them (least recently used first out), and optionally to ask
+    many questions at once via a batch function, in a single round trip.
+
+    Prefetched answers are kept aside until asked for, or until the next
+    prefetch replaces them, regardless of the max. size, so that a batch
+    larger than the cache isn't evicted before it's used.
+    """
+
+    def __init__(
+            self,
+            knows: KnowsFunction,
+            knows_many: Optional[KnowsManyFunction] = None,
+            max_size: int = DEFAULT_CACHE_SIZE):
+
+        self.knows = knows
+        self.knows_many = knows_many
+        self.max_size = max_size
+        self.num_hits = 0
+        self.num_misses = 0
+        self._answers: collections.OrderedDict = collections.OrderedDict()
+        self._prefetched: Dict[Tuple[int, int], bool] = {}
+
+    def __call__(self, person_1: int, person_2: int) -> bool:
+        pair = (person_1, person_2)
+        answer = self._answers.get(pair)
+
+        if answer is not None:
+            self.num_hits += 1
+            self._answers.move_to_end(pair)
+            return answer
+
+        answer = self._prefetched.pop(pair, None)
+
+        if answer is not None:
+            self.num_hits += 1
+            self._remember(pair, answer)
+            return answer
+
+        self.num_misses += 1
+        answer = self.knows(person_1, person_2)
+        self._remember(pair, answer)
+        return answer
+
+    def prefetch(self, pairs: Iterable[Tuple[int, int]]) -> None:
+        """
+        Ask in one batch all questions not already answered, if there's a
+        batch function. Answers are kept until asked for (once), replacing
+        any still unused from the previous batch, and pairs already answered
+        are marked as recently used.
+        """
+
+        if self.knows_many is None:
+            return
+
+        prefetched = {}
+        missing_pairs = []
+
+        for pair in dict.fromkeys(pairs):
+            if pair in self._answers:
+                self._answers.move_to_end(pair)
+            elif pair in self._prefetched:
+                prefetched[pair] = self._prefetched[pair]
+            else:
+                missing_pairs.append(pair)
+
+        if missing_pairs:
+            prefetched.update(
+                zip(missing_pairs, self.knows_many(missing_pairs)))
+
+        self._prefetched = prefetched
+
+    def __len__(self) -> int:
+        """
+        Number of answers kept, cached or prefetched.
+        """
+
+        return len(self._answers) + len(self._prefetched)
+
+    def _remember(self, pair: Tuple[int, int], answer: bool) -> None:
+        self._answers[pair] = answer
+
+        if len(self._answers) > self.max_size:
+            self._answers.popitem(last = False)
+
+
+class KnowsBitset:
+    """
+    Packed bitset of who knows who, with one row per person, where bit `j`
+    of row `i` is set when person `i` knows person `j`. Takes 1 bit per pair.
+
+    Can be called as a knows function.
+    """
+
+    def __init__(self, num_people: int):
+        self.num_people = num_people
+        self.rows = [bytearray((num_people + 7) // 8)
+            for i in range(num_people)]
+
+    @classmethod
+    def from_edges(
+            cls,
+            num_people: int,
+            edges: Iterable[Tuple[int, int]]) -> 'KnowsBitset':
+
+        """
+        Load from `(person, known person)` pairs.
+        """
+
+        graph = cls(num_people)
+
+        for person_1, person_2 in edges:
+            graph.rows[person_1][person_2 >> 3] |= 1 << (person_2 & 7)
+
+        return graph
+
+    def __call__(self, person_1: int, person_2: int) -> bool:
+        if person_1 == person_2:
+            return True
+
+        return bool(
+            (self.rows[person_1][person_2 >> 3] >> (person_2 & 7)) & 1)
+
+    def row_bits(self, person: int) -> int:
+        return int.from_bytes(self.rows[person], 'little')
+
+
+def find_celebrity_bitset(graph: KnowsBitset) -> Optional[int]:
+    """
+    AND all rows together (each also knowing itself) to find who everyone
+    knows, a whole row at-a-time, then check which of those knows no one.
+
+    Time: O(n^2 / w), where w=machine word size in bits
+    Space: O(n / w)
+    """
+
+    if graph.num_people <= 1:
+        return None
+
+    known_by_all = (1 << graph.num_people) - 1
+
+    for person in range(graph.num_people):
+        known_by_all &= graph.row_bits(person) | (1 << person)
+
+        if known_by_all == 0:
+            return None
+
+    while known_by_all:
+        person = (known_by_all & -known_by_all).bit_length() - 1
+
+        if graph.row_bits(person) & ~(1 << person) == 0:
+            return person
+
+        known_by_all &= known_by_all - 1
+
+    return None
+
+
+def find_celebrity_bitset_knows(
+        people: List[int],
+        knows: KnowsFunction) -> Optional[int]:
+
+    return find_celebrity_bitset(KnowsBitset.from_edges(
+        len(people),
+        [(person, other) for person in people for other in people
+            if (person != other) and knows(person, other)]))
+
+
 def knows_matrix(person_1, person_2, known_matrix: List[List[bool]]) -> bool:
     if person_1 == person_2:
         return True
@@ -98,6 +337,8 @@ class Test (unittest.TestCase):
     find_impls = {
         find_celebrity_simple,
         find_celebrity_memory,
+        find_celebrity_elimination,
+        find_celebrity_bitset_knows,
     }
 
     def test_all_know_celebrity(self):
@@ -147,6 +388,225 @@ class Test (unittest.TestCase):
             with self.subTest(find_impl):
                 self.assertEqual(find_impl(people, knows), None)
 
+    def test_random_parties(self):
+        rand = random.Random(0)
+
+        for i in range(200):
+            num_people = rand.randint(2, 8)
+            known_matrix = [[rand.random() < 0.7 for j in range(num_people)]
+                for k in range(num_people)]
+
+            if rand.random() < 0.5:
+                celebrity = rand.randrange(num_people)
+
+                for person in range(num_people):
+                    known_matrix[person][celebrity] = True
+                    known_matrix[celebrity][person] = False
+
+            people = list(range(num_people))
+            knows = partial(knows_matrix, known_matrix = known_matrix)
+
+            celebrities = [person for person in people
+                if all(knows(other, person) and not knows(person, other)
+                    for other in people if other != person)]
+
+            expected = celebrities[0] if celebrities else None
+
+            # The simple implementation doesn't check if everyone knows the
+            # candidate, only that it doesn't know anyone.
+            for find_impl in self.find_impls - {find_celebrity_simple}:
+                with self.subTest(find_impl, known_matrix = known_matrix):
+                    self.assertEqual(find_impl(people, knows), expected)
+
+
+class TestNumQuestions (unittest.TestCase):
+    def setUp(self):
+        self.known_matrix = [
+            [None, True, True, True],
+            [True, None, True, True],
+            [True, True, None, True],
+            [False, False, False, None],
+        ]
+
+        self.people = list(range(len(self.known_matrix)))
+        self.knows = CountingKnows(
+            partial(knows_matrix, known_matrix = self.known_matrix))
+
+    def test_simple(self):
+        self.assertEqual(find_celebrity_simple(self.people, self.knows), 3)
+        self.assertEqual(self.knows.num_calls, 6)
+
+    def test_memory(self):
+        self.assertEqual(find_celebrity_memory(self.people, self.knows), 3)
+        self.assertEqual(self.knows.num_calls, 15)
+
+    def test_elimination(self):
+        self.assertEqual(
+            find_celebrity_elimination(self.people, self.knows),
+            3)
+
+        self.assertEqual(self.knows.num_calls, 9)
+
+    def test_elimination_upper_bound(self):
+        for num_people in range(2, 20):
+            known_matrix = [[True] * num_people for i in range(num_people)]
+            known_matrix[0] = [False] * num_people
+            people = list(range(num_people))
+
+            knows = CountingKnows(
+                partial(knows_matrix, known_matrix = known_matrix))
+
+            with self.subTest(num_people = num_people):
+                self.assertEqual(find_celebrity_elimination(people, knows), 0)
+                self.assertLessEqual(knows.num_calls, 3 * (num_people - 1))
+
+
+class TestKnowsBitset (unittest.TestCase):
+    def test_from_edges(self):
+        graph = KnowsBitset.from_edges(10, [(0, 9), (9, 8), (3, 3)])
+
+        self.assertTrue(graph(0, 9))
+        self.assertTrue(graph(9, 8))
+        self.assertTrue(graph(5, 5))
+        self.assertFalse(graph(9, 0))
+        self.assertFalse(graph(0, 8))
+
+    def test_large_party(self):
+        num_people = 3000
+        celebrity = 1234
+        rand = random.Random(0)
+
+        edges = [(person, rand.randrange(num_people))
+            for person in range(num_people) for i in range(3)]
+
+        edges = [(person, other) for (person, other) in edges
+            if person != celebrity]
+
+        edges.extend((person, celebrity) for person in range(num_people)
+            if person != celebrity)
+
+        graph = KnowsBitset.from_edges(num_people, edges)
+
+        self.assertEqual(find_celebrity_bitset(graph), celebrity)
+        self.assertEqual(
+            find_celebrity_elimination(list(range(num_people)), graph),
+            celebrity)
+
+        graph.rows[celebrity][0] |= 1
+        self.assertIsNone(find_celebrity_bitset(graph))
+
+
+class SlowKnows:
+    """
+    Local stand-in for a slow store of who knows who, with a fixed latency
+    per round trip, for single and batched questions.
+    """
+
+    def __init__(self, known_matrix: List[List[bool]], latency: float = 0):
+        self.known_matrix = known_matrix
+        self.latency = latency
+        self.num_round_trips = 0
+
+    def knows(self, person_1: int, person_2: int) -> bool:
+        self.num_round_trips += 1
+        time.sleep(self.latency)
+        return knows_matrix(person_1, person_2, self.known_matrix)
+
+    def knows_many(self, pairs: List[Tuple[int, int]]) -> List[bool]:
+        self.num_round_trips += 1
+        time.sleep(self.latency)
+
+        return [knows_matrix(person_1, person_2, self.known_matrix)
+            for (person_1, person_2) in pairs]
+
+
+class TestCachedKnows (unittest.TestCase):
+    def setUp(self):
+        num_people = 20
+        self.people = list(range(num_people))
+        self.known_matrix = [[True] * num_people for i in range(num_people)]
+        self.known_matrix[7] = [False] * num_people
+        self.store = SlowKnows(self.known_matrix, latency = 0.0001)
+
+    def test_memoize(self):
+        knows = CachedKnows(self.store.knows)
+
+        for find_impl in Test.find_impls:
+            with self.subTest(find_impl):
+                self.assertEqual(find_impl(self.people, knows), 7)
+
+        self.assertEqual(self.store.num_round_trips, knows.num_misses)
+        self.assertGreater(knows.num_hits, 0)
+        self.assertLessEqual(
+            self.store.num_round_trips,
+            len(self.people) * (len(self.people) - 1))
+
+    def test_bounded_size(self):
+        knows = CachedKnows(self.store.knows, max_size = 2)
+
+        knows(0, 1)
+        knows(0, 2)
+        knows(0, 1)
+        knows(0, 3)
+        self.assertEqual(self.store.num_round_trips, 3)
+
+        knows(0, 1)
+        self.assertEqual(self.store.num_round_trips, 3)
+
+        knows(0, 2)
+        self.assertEqual(self.store.num_round_trips, 4)
+
+    def test_prefetch_verification(self):
+        knows = CachedKnows(self.store.knows, self.store.knows_many)
+
+        self.assertEqual(find_celebrity_elimination(self.people, knows), 7)
+
+        # One round trip per elimination question, plus one batch.
+        self.assertEqual(self.store.num_round_trips, len(self.people))
+
+    def test_prefetch_larger_than_cache(self):
+        knows = CachedKnows(
+            self.store.knows, self.store.knows_many, max_size = 4)
+
+        self.assertEqual(find_celebrity_elimination(self.people, knows), 7)
+        self.assertEqual(self.store.num_round_trips, len(self.people))
+
+    def test_prefetch_bounded_without_celebrity(self):
+        num_people = 50
+        people = list(range(num_people))
+        known_matrix = [[True] * num_people for i in range(num_people)]
+        store = SlowKnows(known_matrix)
+        knows = CachedKnows(store.knows, store.knows_many, max_size = 10)
+
+        for i in range(40):
+            rand = random.Random(i)
+            rand.shuffle(people)
+            self.assertIsNone(find_celebrity_elimination(people, knows))
+
+        # At most the cache, plus one batch of verification questions.
+        self.assertLessEqual(len(knows), 10 + 2 * (num_people - 1))
+
+    def test_prefetch_keeps_cached_answers(self):
+        knows = CachedKnows(
+            self.store.knows, self.store.knows_many, max_size = 2)
+
+        knows(0, 1)
+        knows(0, 2)
+        knows.prefetch([(0, 1), (0, 3)])
+        knows(0, 3)
+        self.assertEqual(self.store.num_round_trips, 3)
+
+        knows(0, 1)
+        self.assertEqual(self.store.num_round_trips, 3)
+
+    def test_prefetch_without_batch_function(self):
+        knows = CachedKnows(self.store.knows)
+
+        self.assertEqual(find_celebrity_elimination(self.people, knows), 7)
+        self.assertLessEqual(
+            self.store.num_round_trips,
+            3 * (len(self.people) - 1))
+
 
 if __name__ == '__main__':
     unittest.main(verbosity = 2)
@@ -9,7 +9,13 @@ https://en.wikipedia.org/wiki/Breadth-first_search
 Time: O(V+E)
 """
 
+from array import array
 import collections
+import heapq
+import math
+import sys
+import time
+import tracemalloc
 import unittest
 
 Road = collections.namedtuple('Road', ['houses', 'inter_a', 'inter_b'])
@@ -23,22 +29,133 @@ class Intersect:
         return hash(self.name)
 
     def __eq__(self, other):
-        return hash(self) == hash(other)
+        if not isinstance(other, Intersect):
+            return NotImplemented
+
+        return self.name == other.name
+
+def add_road(houses, inter_a, inter_b):
+    road = Road(houses = houses, inter_a = inter_a, inter_b = inter_b)
+
+    for inter in (inter_a, inter_b):
+        if inter is not None:
+            inter.roads.append(road)
+
+    return road
+
+class NetworkIntersect:
+    """
+    Intersection interned by name in a `RoadNetwork`, so that it's compared
+    and hashed by identity. Has no ID, since searches only index roads.
+    """
+
+    __slots__ = ('name', 'roads')
+
+    def __init__(self, name):
+        self.name = name
+        self.roads = []
+
+class NetworkRoad:
+    """
+    Same as `Road`, but with a small integer ID, and compared and hashed by
+    identity instead of by value.
+    """
+
+    __slots__ = ('id', 'houses', 'inter_a', 'inter_b')
+
+    def __init__(self, id, houses, inter_a, inter_b):
+        self.id = id
+        self.houses = houses
+        self.inter_a = inter_a
+        self.inter_b = inter_b
+
+class RoadNetwork:
+    """
+    Allocates consecutive integer IDs to roads, and interns intersections by
+    name, so that searches can keep per-road state in flat arrays indexed by
+    ID and compare nodes by identity.
+
+    Trades memory for speed: the slotted intersections are smaller than
+    `Intersect`, but each road's ID is an int object of its own, and the
+    interning table holds an entry per intersection, so the whole network
+    takes more memory than the plain model (see `benchmark`).
+    """
+
+    def __init__(self):
+        self.roads = []
+        self._name_to_inter = {}
+
+    def intersect(self, name):
+        inter = self._name_to_inter.get(name)
+
+        if inter is None:
+            inter = self._name_to_inter[name] = NetworkIntersect(name)
+
+        return inter
+
+    @property
+    def inters(self):
+        return list(self._name_to_inter.values())
+
+    def add_road(self, houses, inter_a, inter_b):
+        road = NetworkRoad(len(self.roads), houses, inter_a, inter_b)
+        self.roads.append(road)
+
+        for inter in (inter_a, inter_b):
+            if inter is not None:
+                inter.roads.append(road)
+
+        return road
+
+def shortest_path_network(network, start, house):
+    """
+    Same as `shortest_path`, but for a `RoadNetwork`, with the visited roads
+    in a bytearray and their previous roads in an array, both indexed by ID.
+    """
+
+    roads = network.roads
+    visited = bytearray(len(roads))
+    prev = array('i' if len(roads) < 2**31 else 'q', [-1]) * len(roads)
+    queue = collections.deque([start])
+    visited[start.id] = True
+
+    while len(queue) > 0:
+        current_road = queue.popleft()
+
+        if house in current_road.houses:
+            path = []
+            road_id = current_road.id
+
+            while road_id != -1:
+                path.append(roads[road_id])
+                road_id = prev[road_id]
+
+            path.reverse()
+            return path
+
+        for next_road in next_roads(current_road):
+            if not visited[next_road.id]:
+                visited[next_road.id] = True
+                prev[next_road.id] = current_road.id
+                queue.append(next_road)
+
+    return None
 
 def shortest_path(start, house):
-    queue = [start]
+    queue = collections.deque([start])
     road_to_prev = {start: None}
 
     while len(queue) > 0:
-        current_road = queue.pop(0)
+        current_road = queue.popleft()
 
         if house in current_road.houses:
             path = []
 
             while current_road is not None:
-                path.insert(0, current_road)
+                path.append(current_road)
                 current_road = road_to_prev[current_road]
 
+            path.reverse()
             return path
 
         for inter in (current_road.inter_a, current_road.inter_b):
@@ -50,6 +167,418 @@ def shortest_path(start, house):
 
     return None
 
+def next_roads(road):
+    for inter in (road.inter_a, road.inter_b):
+        if inter is not None:
+            yield from inter.roads
+
+def find_house_roads(roads, house):
+    return [road for road in roads if house in road.houses]
+
+class HouseIndex:
+    """
+    Index of roads by house number, built once for a road network (and
+    updated as roads are added), to look up destination roads in O(1).
+
+    Only indexes roads, which must already be linked to their intersections
+    (eg. with `add_road`).
+    """
+
+    def __init__(self, roads = ()):
+        self._house_to_roads = collections.defaultdict(list)
+
+        for road in roads:
+            self.index_road(road)
+
+    def index_road(self, road):
+        for house in road.houses:
+            self._house_to_roads[house].append(road)
+
+    def roads(self, house):
+        return list(self._house_to_roads.get(house, ()))
+
+def shortest_path_indexed(start, house, index):
+    """
+    Same as `shortest_path`, but stops on reaching any of the roads indexed
+    for `house`, checked by identity, instead of scanning each road's houses.
+    """
+
+    destination_ids = {id(road) for road in index.roads(house)}
+
+    if not destination_ids:
+        return None
+
+    queue = collections.deque([start])
+    road_to_prev = {start: None}
+
+    while len(queue) > 0:
+        current_road = queue.popleft()
+
+        if id(current_road) in destination_ids:
+            path = []
+
+            while current_road is not None:
+                path.append(current_road)
+                current_road = road_to_prev[current_road]
+
+            path.reverse()
+            return path
+
+        for next_road in next_roads(current_road):
+            if next_road not in road_to_prev:
+                road_to_prev[next_road] = current_road
+                queue.append(next_road)
+
+    return None
+
+def shortest_path_bidirectional(start, destinations):
+    """
+    Search both forward from road `start` and backward from all roads in
+    `destinations` (eg. the roads containing a house) at the same time, one
+    whole BFS level at-a-time on the side with the smallest frontier, until
+    both searches meet in the middle.
+
+    Time: O(V+E), but typically visits far fewer roads than a forward BFS
+    """
+
+    destinations = list(destinations)
+
+    if start in destinations:
+        return [start]
+
+    forward = (collections.deque([start]), {start: None}, {start: 0})
+    backward = (
+        collections.deque(destinations),
+        dict.fromkeys(destinations),
+        dict.fromkeys(destinations, 0))
+
+    while (len(forward[0]) > 0) and (len(backward[0]) > 0):
+        if len(forward[0]) <= len(backward[0]):
+            (this, other) = (forward, backward)
+        else:
+            (this, other) = (backward, forward)
+
+        (queue, road_to_prev, road_to_dist) = this
+        (_, other_road_to_prev, other_road_to_dist) = other
+        meeting = None
+
+        for i in range(len(queue)):
+            current_road = queue.popleft()
+            dist = road_to_dist[current_road] + 1
+
+            for next_road in next_roads(current_road):
+                if next_road in road_to_prev:
+                    continue
+
+                road_to_prev[next_road] = current_road
+                road_to_dist[next_road] = dist
+                queue.append(next_road)
+
+                if next_road in other_road_to_prev:
+                    total_dist = dist + other_road_to_dist[next_road]
+
+                    if (meeting is None) or (total_dist < meeting[0]):
+                        meeting = (total_dist, next_road)
+
+        if meeting is not None:
+            path = []
+            current_road = meeting[1]
+
+            while current_road is not None:
+                path.append(current_road)
+                current_road = forward[1][current_road]
+
+            path.reverse()
+            current_road = backward[1][meeting[1]]
+
+            while current_road is not None:
+                path.append(current_road)
+                current_road = backward[1][current_road]
+
+            return path
+
+    return None
+
+class RouteService:
+    """
+    Answers many shortest path queries on the same road network, by keeping
+    a BFS tree of predecessors for each recently used start road, up to a
+    max. number of trees (least recently used first out). Later queries from
+    the same start road then just walk the path back from the destination.
+
+    The cached trees must be invalidated when the network changes, which
+    `add_road` does. Roads added otherwise (eg. with the module level
+    `add_road`) must be indexed with `index.index_road`, followed by a call
+    to `invalidate`.
+    """
+
+    def __init__(self, roads, max_trees = 16):
+        self.index = HouseIndex(roads)
+        self.max_trees = max_trees
+        self.num_hits = 0
+        self.num_misses = 0
+        self._trees = collections.OrderedDict()
+
+    def shortest_path(self, start, house):
+        tree = self._tree(start)
+        destination = None
+        destination_order = None
+
+        # Pick the same destination as a forward BFS would reach first.
+        for road in self.index.roads(house):
+            if road in tree:
+                order = tree[road][1]
+
+                if (destination is None) or (order < destination_order):
+                    (destination, destination_order) = (road, order)
+
+        if destination is None:
+            return None
+
+        path = []
+
+        while destination is not None:
+            path.append(destination)
+            destination = tree[destination][0]
+
+        path.reverse()
+        return path
+
+    def add_road(self, houses, inter_a, inter_b):
+        """
+        Same as the module level `add_road`, but also indexes the new road
+        and invalidates the cached trees.
+        """
+
+        road = add_road(houses, inter_a, inter_b)
+        self.index.index_road(road)
+        self.invalidate()
+        return road
+
+    def invalidate(self):
+        self._trees.clear()
+
+    def _tree(self, start):
+        """
+        Get the BFS tree from a start road, as a map of each reachable road
+        to its previous road and its BFS visit order.
+        """
+
+        tree = self._trees.get(start)
+
+        if tree is not None:
+            self.num_hits += 1
+            self._trees.move_to_end(start)
+            return tree
+
+        self.num_misses += 1
+        tree = {start: (None, 0)}
+        queue = collections.deque([start])
+
+        while len(queue) > 0:
+            current_road = queue.popleft()
+
+            for next_road in next_roads(current_road):
+                if next_road not in tree:
+                    tree[next_road] = (current_road, len(tree))
+                    queue.append(next_road)
+
+        self._trees[start] = tree
+
+        if len(self._trees) > self.max_trees:
+            self._trees.popitem(last = False)
+
+        return tree
+
+class RoadGraph:
+    """
+    Road network compiled into compressed sparse row (CSR) arrays: each road
+    gets an integer ID (its position in `roads`), and the IDs of the roads
+    reachable from road `i` are `neighbors[offsets[i]:offsets[i + 1]]`. Each
+    road can also have a length, which defaults to 1.
+    """
+
+    def __init__(self, roads, lengths = None):
+        self.roads = list(roads)
+        typecode = 'i' if len(self.roads) < 2**31 else 'q'
+        road_to_id = {id(road): i for (i, road) in enumerate(self.roads)}
+
+        self.offsets = array(typecode, [0])
+        self.neighbors = array(typecode)
+
+        if lengths is None:
+            self.lengths = array('d', [1]) * len(self.roads)
+        else:
+            self.lengths = array('d', lengths)
+
+            if len(self.lengths) != len(self.roads):
+                raise ValueError('%s lengths for %s roads'
+                    % (len(self.lengths), len(self.roads)))
+
+        for road in self.roads:
+            road_ids = set()
+
+            for next_road in next_roads(road):
+                if next_road is not road:
+                    try:
+                        road_ids.add(road_to_id[id(next_road)])
+                    except KeyError:
+                        raise ValueError('road not in graph: %r'
+                            % (next_road,)) from None
+
+            self.neighbors.extend(sorted(road_ids))
+            self.offsets.append(len(self.neighbors))
+
+def search_weighted(graph, start, destinations, heuristic = None):
+    """
+    Find the road path with the shortest total length (including the start
+    and destination roads) from road ID `start` to any road ID in
+    `destinations`, with Dijkstra's algorithm, or A* when a `heuristic` is
+    given. Returns `(total length, [road IDs])`, or `None` if not found.
+
+    The heuristic must never overestimate the remaining length from a road
+    to the nearest destination (not counting that road's own length), and
+    must be consistent.
+
+    Time: O((V+E)*log(V))
+    Space: O(V)
+    """
+
+    destinations = set(destinations)
+    dist = array('d', [math.inf]) * len(graph.roads)
+    prev = array(graph.neighbors.typecode, [-1]) * len(graph.roads)
+    (offsets, neighbors, lengths) = (
+        graph.offsets, graph.neighbors, graph.lengths)
+
+    dist[start] = lengths[start]
+    heap = [(dist[start] + (heuristic(start) if heuristic else 0), start)]
+
+    while heap:
+        (priority, road) = heapq.heappop(heap)
+        road_dist = dist[road]
+
+        if priority > road_dist + (heuristic(road) if heuristic else 0):
+            continue
+
+        if road in destinations:
+            path = []
+
+            while road != -1:
+                path.append(road)
+                road = prev[road]
+
+            path.reverse()
+            return (road_dist, path)
+
+        for i in range(offsets[road], offsets[road + 1]):
+            next_road = neighbors[i]
+            next_dist = road_dist + lengths[next_road]
+
+            if next_dist < dist[next_road]:
+                dist[next_road] = next_dist
+                prev[next_road] = road
+                heapq.heappush(heap, (
+                    next_dist + (heuristic(next_road) if heuristic else 0),
+                    next_road))
+
+    return None
+
+def dijkstra(graph, start, destinations):
+    return search_weighted(graph, start, destinations)
+
+def astar(graph, start, destinations, heuristic):
+    return search_weighted(graph, start, destinations, heuristic)
+
+def euclidean_heuristic(coords, destinations):
+    """
+    Straight-line distance to the nearest destination, given `(x, y)`
+    coordinates per road ID, admissible when road lengths are never shorter
+    than the distance between the coordinates of neighbor roads.
+    """
+
+    destination_coords = [coords[road] for road in destinations]
+
+    def heuristic(road):
+        (x, y) = coords[road]
+
+        return min(
+            math.hypot(x - dest_x, y - dest_y)
+            for (dest_x, dest_y) in destination_coords)
+
+    return heuristic
+
+def make_grid_roads(num_rows, num_cols, network = None):
+    """
+    Make a grid of intersections, with roads joining each one to the next
+    one on its right and below it, and one house per road numbered in order.
+    Uses a `RoadNetwork` when given one.
+    """
+
+    if network is None:
+        (new_intersect, new_road) = (Intersect, add_road)
+    else:
+        (new_intersect, new_road) = (network.intersect, network.add_road)
+
+    inters = [[new_intersect((row, col)) for col in range(num_cols)]
+        for row in range(num_rows)]
+
+    roads = []
+
+    for row in range(num_rows):
+        for col in range(num_cols):
+            for (next_row, next_col) in ((row, col + 1), (row + 1, col)):
+                if (next_row < num_rows) and (next_col < num_cols):
+                    roads.append(new_road(
+                        (len(roads),),
+                        inters[row][col],
+                        inters[next_row][next_col]))
+
+    return roads
+
+def is_valid_path(path):
+    for (road, next_road) in zip(path, path[1:]):
+        if next_road not in list(next_roads(road)):
+            return False
+
+    return True
+
+def benchmark(side_len = 707):
+    """
+    Compare memory and search time of both road models on a grid of about
+    `2 * side_len^2` roads (1M by default).
+    """
+
+    num_roads = 2 * side_len * (side_len - 1)
+    network = RoadNetwork()
+
+    def make_roads():
+        return make_grid_roads(side_len, side_len)
+
+    def make_network_roads():
+        return make_grid_roads(side_len, side_len, network)
+
+    def search(roads):
+        return shortest_path(roads[0], num_roads - 1)
+
+    def search_network(roads):
+        return shortest_path_network(network, roads[0], num_roads - 1)
+
+    for (name, make, search) in [
+            ('Road/Intersect', make_roads, search),
+            ('RoadNetwork', make_network_roads, search_network)]:
+
+        tracemalloc.start()
+        roads = make()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        path = search(roads)
+        seconds = time.perf_counter() - start
+
+        print('%-16s roads=%s memory=%.1f MB search=%.2f s path=%s' % (
+            name, len(roads), memory / 2**20, seconds, len(path)))
+
 class TestMapInvertedA (unittest.TestCase):
     def setUp(self):
         self.NW_inter = Intersect('NW')
@@ -103,6 +632,9 @@ class TestMapInvertedA (unittest.TestCase):
         self.NE_inter.roads.append(self.SE_road)
         self.SE_inter.roads.append(self.SE_road)
 
+        self.roads = [self.NW_road, self.SW_road, self.N_road, self.S_road,
+            self.NE_road, self.SE_road]
+
     def test_from_north_west_to_north_east(self):
         self.assertListEqual(
             shortest_path(self.NW_road, 11),
@@ -113,5 +645,216 @@ class TestMapInvertedA (unittest.TestCase):
             shortest_path(self.NE_road, 12),
             [self.NE_road, self.SE_road])
 
+    def test_bidirectional(self):
+        for (start, house, path) in [
+                (self.NW_road, 11, [self.NW_road, self.N_road, self.NE_road]),
+                (self.NE_road, 12, [self.NE_road, self.SE_road]),
+                (self.SW_road, 4, [self.SW_road])]:
+
+            with self.subTest(house = house):
+                self.assertListEqual(
+                    shortest_path_bidirectional(
+                        start,
+                        find_house_roads(self.roads, house)),
+                    path)
+
+    def test_bidirectional_not_found(self):
+        self.assertIsNone(shortest_path_bidirectional(self.NW_road, []))
+        self.assertIsNone(shortest_path(self.NW_road, 99))
+
+class TestHouseIndex (unittest.TestCase):
+    def setUp(self):
+        self.roads = make_grid_roads(6, 7)
+        self.index = HouseIndex(self.roads)
+
+    def test_lookup(self):
+        self.assertEqual(self.index.roads(5), [self.roads[5]])
+        self.assertEqual(self.index.roads(-1), [])
+
+    def test_index_road(self):
+        road = add_road((5, 1000), self.roads[0].inter_a, None)
+        self.index.index_road(road)
+
+        self.assertEqual(self.index.roads(5), [self.roads[5], road])
+        self.assertEqual(self.index.roads(1000), [road])
+        self.assertEqual(
+            shortest_path_indexed(self.roads[0], 1000, self.index),
+            [self.roads[0], road])
+
+    def test_same_as_shortest_path(self):
+        for (start_num, house) in [(0, 50), (5, 6), (60, 3), (17, 17)]:
+            with self.subTest(start = start_num, house = house):
+                start = self.roads[start_num]
+                forward_path = shortest_path(start, house)
+
+                self.assertEqual(
+                    shortest_path_indexed(start, house, self.index),
+                    forward_path)
+
+                self.assertEqual(
+                    len(shortest_path_bidirectional(
+                        start, self.index.roads(house))),
+                    len(forward_path))
+
+    def test_not_found(self):
+        self.assertIsNone(
+            shortest_path_indexed(self.roads[0], -1, self.index))
+
+class TestRoadGraph (unittest.TestCase):
+    def setUp(self):
+        self.num_rows = 6
+        self.num_cols = 7
+        self.roads = make_grid_roads(self.num_rows, self.num_cols)
+        self.graph = RoadGraph(self.roads)
+
+    def test_csr_arrays(self):
+        self.assertEqual(len(self.graph.offsets), len(self.roads) + 1)
+        self.assertEqual(self.graph.offsets[-1], len(self.graph.neighbors))
+
+        # Top-left horizontal road: down one at its left end, right and down
+        # ones at its right end.
+        self.assertEqual(
+            [self.roads[i].houses for i in
+                self.graph.neighbors[self.graph.offsets[0]:
+                    self.graph.offsets[1]]],
+            [(1,), (2,), (3,)])
+
+    def test_unit_lengths_same_as_bfs(self):
+        for (start, house) in [(0, 50), (5, 6), (60, 3), (17, 17)]:
+            with self.subTest(start = start, house = house):
+                (length, path) = dijkstra(self.graph, start, [house])
+
+                self.assertEqual(
+                    length,
+                    len(shortest_path(self.roads[start], house)))
+
+                self.assertEqual(len(path), length)
+                self.assertTrue(is_valid_path(
+                    [self.roads[road] for road in path]))
+
+    def test_astar_same_as_dijkstra(self):
+        coords = []
+
+        for road in self.roads:
+            ((row_a, col_a), (row_b, col_b)) = (
+                road.inter_a.name, road.inter_b.name)
+
+            coords.append(((col_a + col_b) / 2, (row_a + row_b) / 2))
+
+        for (start, destinations) in [(0, [50]), (60, [3, 40]), (7, [7])]:
+            with self.subTest(start = start, destinations = destinations):
+                heuristic = euclidean_heuristic(coords, destinations)
+
+                self.assertEqual(
+                    astar(self.graph, start, destinations, heuristic)[0],
+                    dijkstra(self.graph, start, destinations)[0])
+
+    def test_weighted_detour(self):
+        lengths = array('d', [1]) * len(self.roads)
+
+        # Make the top-left horizontal road very long, so that going between
+        # the first two down roads takes the horizontal road below it.
+        lengths[0] = 100
+        graph = RoadGraph(self.roads, lengths)
+        below_road = 2 * self.num_cols - 1
+
+        self.assertEqual(
+            dijkstra(graph, 1, [3]),
+            (3, [1, below_road, 3]))
+
+        self.assertEqual(dijkstra(graph, 1, [0]), (101, [1, 0]))
+
+    def test_not_found(self):
+        graph = RoadGraph([Road(houses = (), inter_a = None, inter_b = None)])
+        self.assertIsNone(dijkstra(graph, 0, []))
+
+    def test_road_not_in_graph(self):
+        with self.assertRaises(ValueError):
+            RoadGraph(self.roads[:3])
+
+class TestRouteService (unittest.TestCase):
+    def setUp(self):
+        self.roads = make_grid_roads(6, 7)
+        self.service = RouteService(self.roads, max_trees = 2)
+
+    def test_same_as_shortest_path(self):
+        for start in [0, 5, 60, 17]:
+            for house in [50, 6, 3, 17, -1]:
+                with self.subTest(start = start, house = house):
+                    self.assertEqual(
+                        self.service.shortest_path(self.roads[start], house),
+                        shortest_path(self.roads[start], house))
+
+        self.assertEqual(self.service.num_misses, 4)
+        self.assertEqual(self.service.num_hits, 16)
+
+    def test_lru_eviction(self):
+        for start in [0, 1, 0, 2, 1, 0]:
+            self.service.shortest_path(self.roads[start], 50)
+
+        self.assertEqual(self.service.num_hits, 1)
+        self.assertEqual(self.service.num_misses, 5)
+
+    def test_add_road_invalidates(self):
+        self.service.shortest_path(self.roads[0], 50)
+        self.assertIsNone(self.service.shortest_path(self.roads[0], 1000))
+
+        road = self.service.add_road((1000,), self.roads[0].inter_a, None)
+
+        self.assertEqual(
+            self.service.shortest_path(self.roads[0], 1000),
+            [self.roads[0], road])
+
+        self.assertEqual(self.service.num_hits, 1)
+        self.assertEqual(self.service.num_misses, 2)
+
+class TestIntersect (unittest.TestCase):
+    def test_hash_collision(self):
+        # Small integers -1 and -2 have the same hash in CPython.
+        self.assertNotEqual(Intersect(-1), Intersect(-2))
+        self.assertEqual(Intersect('a'), Intersect('a'))
+
+class TestRoadNetwork (unittest.TestCase):
+    def setUp(self):
+        self.network = RoadNetwork()
+        self.roads = make_grid_roads(6, 7, self.network)
+
+    def test_ids(self):
+        self.assertEqual(
+            [road.id for road in self.network.roads],
+            list(range(len(self.roads))))
+
+        self.assertIs(self.network.intersect((2, 3)),
+            self.network.intersect((2, 3)))
+
+        self.assertEqual(len(self.network.inters), 6 * 7)
+
+    def test_same_as_shortest_path(self):
+        for (start, house) in [(0, 50), (5, 6), (60, 3), (17, 17), (0, -1)]:
+            with self.subTest(start = start, house = house):
+                self.assertEqual(
+                    shortest_path_network(
+                        self.network, self.roads[start], house),
+                    shortest_path(self.roads[start], house))
+
+class TestGrid (unittest.TestCase):
+    def test_bidirectional_same_length(self):
+        roads = make_grid_roads(8, 9)
+
+        for (start_num, house) in [(0, 100), (5, 6), (120, 3), (77, 77)]:
+            with self.subTest(start = start_num, house = house):
+                forward_path = shortest_path(roads[start_num], house)
+                path = shortest_path_bidirectional(
+                    roads[start_num],
+                    find_house_roads(roads, house))
+
+                self.assertEqual(len(path), len(forward_path))
+                self.assertIs(path[0], roads[start_num])
+                self.assertIn(house, path[-1].houses)
+                self.assertTrue(is_valid_path(path))
+
 if __name__ == '__main__':
-    unittest.main(verbosity = 2)
+    if sys.argv[1:2] == ['--benchmark']:
+        benchmark(*map(int, sys.argv[2:]))
+    else:
+        unittest.main(verbosity = 2)
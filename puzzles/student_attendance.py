@@ -10,15 +10,49 @@ Check if a student is in trouble based on his/her attendance record:
 The student is in trouble if 2x absent or 3x late in a row.
 
 Also generate a string up to length N of all combinations where the user
-is not in trouble.
+is not in trouble, or just count them.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+import random
+import re
+import tempfile
 import unittest
 
 OK = 'o'
 LATE = 'l'
 ABSENT = 'a'
 
+RECORDS = (OK, ABSENT, LATE)
+
+MAX_NUM_ABSENT = 1
+MAX_NUM_LATE = 2
+
+# Passing states, as `(num. absent, num. late in a row at the end)`.
+STATES = [(num_absent, num_late)
+    for num_absent in range(MAX_NUM_ABSENT + 1)
+    for num_late in range(MAX_NUM_LATE + 1)]
+
+# Shortest run of late records in a row that's in trouble.
+LATE_RUN = LATE * (MAX_NUM_LATE + 1)
+
+# Same as `ABSENT` and `LATE_RUN`, for records as bytes.
+ABSENT_BYTES = ABSENT.encode()
+LATE_RUN_BYTES = LATE_RUN.encode()
+
+# Matches within a record in trouble, in a buffer of records
+# separated by newlines.
+TROUBLE_PATTERN = re.compile(
+    rb'%s|%s[^\n]*%s' % (LATE_RUN_BYTES, ABSENT_BYTES, ABSENT_BYTES))
+
+# Default size in bytes of the chunks a buffer of records is screened in.
+DEFAULT_CHUNK_SIZE = 16 * 2**20
+
+# Lengths up to which counting is done by dynamic programming, instead of
+# by matrix exponentiation.
+COUNT_DP_MAX_LENGTH = 64
+
 def is_in_trouble(attendance):
     """
     Time: O(n)
@@ -46,6 +80,398 @@ def is_in_trouble(attendance):
 
     return False
 
+def screen_records(records):
+    """
+    Time: O(n), where n=total length of all records
+    Space: O(r), where r=number of records
+
+    Returns `(number of records, bitmap)` of which records (`str` or
+    `bytes`) are in trouble, where bit `i % 8` of byte `i // 8` is set if
+    record `i` is, checked with bulk string searches per record instead of
+    one character at-a-time.
+    """
+
+    bitmap = bytearray((len(records) + 7) // 8)
+
+    for (i, record) in enumerate(records):
+        if isinstance(record, str):
+            (absent, late_run) = (ABSENT, LATE_RUN)
+        else:
+            (absent, late_run) = (ABSENT_BYTES, LATE_RUN_BYTES)
+
+        if (record.count(absent) > MAX_NUM_ABSENT) or (late_run in record):
+            bitmap[i >> 3] |= 1 << (i & 7)
+
+    return (len(records), bitmap)
+
+def screen_chunk(chunk):
+    """
+    Returns `(number of records, [record index in trouble, ...])` for a chunk
+    of newline separated records, found with a regular expression over the
+    whole chunk at once.
+    """
+
+    num_records = chunk.count(b'\n')
+
+    if chunk and not chunk.endswith(b'\n'):
+        num_records += 1
+
+    in_trouble = []
+    record = 0
+    last_pos = 0
+
+    for match in TROUBLE_PATTERN.finditer(chunk):
+        record += chunk.count(b'\n', last_pos, match.start())
+        last_pos = match.start()
+
+        # A record can match more than once, e.g. late streak then absences.
+        if not in_trouble or in_trouble[-1] != record:
+            in_trouble.append(record)
+
+    return (num_records, in_trouble)
+
+def split_chunks(data, chunk_size):
+    """
+    Split a buffer into `(start, end)` chunks of about `chunk_size` bytes,
+    right after newlines.
+    """
+
+    start = 0
+
+    while start < len(data):
+        end = start + chunk_size
+
+        if end >= len(data):
+            end = len(data)
+        else:
+            newline = data.find(b'\n', end - 1)
+            end = len(data) if newline == -1 else newline + 1
+
+        yield (start, end)
+        start = end
+
+def screen_file_chunk(path, start, end):
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as mm:
+
+        return screen_chunk(mm[start:end])
+
+def screen_buffer(data, chunk_size = DEFAULT_CHUNK_SIZE):
+    """
+    Time: O(n), where n=buffer length
+    Space: O(r + c), where r=number of records, c=chunk size
+
+    Same as `screen_records`, but for newline separated records in a buffer
+    (`bytes`, `bytearray`, `mmap`), screened one chunk at-a-time.
+    """
+
+    return merge_screened_chunks(
+        screen_chunk(data[start:end])
+        for (start, end) in split_chunks(data, chunk_size))
+
+def merge_screened_chunks(results):
+    num_records = 0
+    in_trouble = []
+
+    for (chunk_num_records, chunk_in_trouble) in results:
+        in_trouble.extend(num_records + record for record in chunk_in_trouble)
+        num_records += chunk_num_records
+
+    bitmap = bytearray((num_records + 7) // 8)
+
+    for record in in_trouble:
+        bitmap[record >> 3] |= 1 << (record & 7)
+
+    return (num_records, bitmap)
+
+def screen_file(path, num_processes = None, chunk_size = DEFAULT_CHUNK_SIZE):
+    """
+    Same as `screen_buffer`, but for a file through a memory map, with its
+    chunks screened in a pool of processes if `num_processes` is given
+    (each process mapping the file on its own).
+    """
+
+    with open(path, 'rb') as file:
+        if file.seek(0, 2) == 0:
+            return (0, bytearray())
+
+        with mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as mm:
+            if num_processes is None:
+                return screen_buffer(mm, chunk_size)
+
+            chunks = list(split_chunks(mm, chunk_size))
+
+    with ProcessPoolExecutor(max_workers = num_processes) as pool:
+        return merge_screened_chunks(pool.map(
+            screen_file_chunk,
+            [path] * len(chunks),
+            [start for (start, end) in chunks],
+            [end for (start, end) in chunks]))
+
+def is_bit_set(bitmap, i):
+    return bool(bitmap[i >> 3] & (1 << (i & 7)))
+
+def next_state(state, record):
+    """
+    Returns the state after a record, or `None` if then in trouble.
+    """
+
+    (num_absent, num_late) = state
+
+    if record == ABSENT:
+        num_absent += 1
+        num_late = 0
+    elif record == LATE:
+        num_late += 1
+    else:
+        num_late = 0
+
+    if (num_absent > MAX_NUM_ABSENT) or (num_late > MAX_NUM_LATE):
+        return None
+
+    return (num_absent, num_late)
+
+# Next state index per state index and record, `None` if then in trouble.
+TRANSITIONS = [
+    [None if next_state(state, record) is None
+        else STATES.index(next_state(state, record))
+        for record in RECORDS]
+    for state in STATES]
+
+def check_length(length):
+    if length < 0:
+        raise ValueError('negative length: %r' % length)
+
+def count_pass_dp(length, modulus = None):
+    """
+    Time: O(n)
+    Space: O(1)
+
+    Count, for each state, how many passing suffixes of each length there
+    are starting from it, from the shortest to the longest.
+    """
+
+    check_length(length)
+
+    counts = [1] * len(STATES)
+
+    for i in range(length):
+        counts = [
+            sum(counts[next_state] for next_state in transitions
+                if next_state is not None)
+            for transitions in TRANSITIONS]
+
+        if modulus is not None:
+            counts = [count % modulus for count in counts]
+
+    return counts[0]
+
+def multiply_matrices(a, b, modulus = None):
+    product = [
+        [sum(a[i][k] * b[k][j] for k in range(len(b)))
+            for j in range(len(b[0]))]
+        for i in range(len(a))]
+
+    if modulus is not None:
+        product = [[value % modulus for value in row] for row in product]
+
+    return product
+
+def count_pass_matrix(length, modulus = None):
+    """
+    Time: O(log n) matrix multiplications
+    Space: O(1)
+
+    Raise the automaton's transition matrix to the `length`-th power, by
+    repeated squaring, then count the paths from the starting state.
+    """
+
+    check_length(length)
+
+    power = [[0] * len(STATES) for state in STATES]
+
+    for (state, transitions) in enumerate(TRANSITIONS):
+        for next_state in transitions:
+            if next_state is not None:
+                power[state][next_state] += 1
+
+    result = [[int(i == j) for j in range(len(STATES))]
+        for i in range(len(STATES))]
+
+    while length > 0:
+        if length & 1:
+            result = multiply_matrices(result, power, modulus)
+
+        power = multiply_matrices(power, power, modulus)
+        length >>= 1
+
+    count = sum(result[0])
+    return count % modulus if modulus is not None else count
+
+def count_pass(length, modulus = None):
+    """
+    Count how many records of a given length pass, without generating them,
+    optionally modulo a number (to keep them small for huge lengths).
+    """
+
+    check_length(length)
+
+    if length <= COUNT_DP_MAX_LENGTH:
+        return count_pass_dp(length, modulus)
+    else:
+        return count_pass_matrix(length, modulus)
+
+# Record indexes (into `RECORDS`) in lexicographic order of their records.
+SORTED_RECORD_INDEXES = sorted(
+    range(len(RECORDS)),
+    key = RECORDS.__getitem__)
+
+def count_suffixes(length):
+    """
+    Returns how many passing suffixes of each length there are starting from
+    each state, as `counts[suffix length][state index]`.
+
+    Time: O(n)
+    Space: O(n)
+    """
+
+    check_length(length)
+    counts = [[1] * len(STATES)]
+
+    for i in range(length):
+        counts.append([
+            sum(counts[-1][next_state] for next_state in transitions
+                if next_state is not None)
+            for transitions in TRANSITIONS])
+
+    return counts
+
+def iter_pass(length):
+    """
+    Time: O(n) per record
+    Space: O(n)
+
+    Yields passing records one at-a-time, in lexicographic order, by walking
+    the automaton depth-first with an explicit stack.
+    """
+
+    check_length(length)
+
+    records = []
+    states = [0]
+    choices = [0]
+
+    while choices:
+        if len(records) == length:
+            yield ''.join(records)
+            choice = len(RECORDS)
+        else:
+            choice = choices[-1]
+
+        if choice == len(RECORDS):
+            choices.pop()
+            states.pop()
+
+            if records:
+                records.pop()
+
+            continue
+
+        choices[-1] += 1
+        record_index = SORTED_RECORD_INDEXES[choice]
+        next_state = TRANSITIONS[states[-1]][record_index]
+
+        if next_state is not None:
+            records.append(RECORDS[record_index])
+            states.append(next_state)
+            choices.append(0)
+
+def rank(attendance, counts = None):
+    """
+    Time: O(n)
+    Space: O(n), or O(1) if given `count_suffixes` for at least its length
+
+    Position of a passing record among all of the same length, in
+    lexicographic order.
+    """
+
+    if counts is None:
+        counts = count_suffixes(len(attendance))
+
+    position = 0
+    state = 0
+
+    for (i, record) in enumerate(attendance):
+        if record not in RECORDS:
+            raise ValueError('invalid record: %r' % record)
+
+        remaining = len(attendance) - i - 1
+
+        for record_index in SORTED_RECORD_INDEXES:
+            next_state = TRANSITIONS[state][record_index]
+
+            if RECORDS[record_index] == record:
+                break
+
+            if next_state is not None:
+                position += counts[remaining][next_state]
+
+        if next_state is None:
+            raise ValueError('in trouble: %r' % attendance)
+
+        state = next_state
+
+    return position
+
+def unrank(position, length, counts = None):
+    """
+    Time: O(n)
+    Space: O(n), or O(1) if given `count_suffixes` for at least its length
+
+    Passing record at a position among all of a given length, in
+    lexicographic order.
+    """
+
+    check_length(length)
+
+    if counts is None:
+        counts = count_suffixes(length)
+
+    if (position < 0) or (position >= counts[length][0]):
+        raise IndexError(position)
+
+    records = []
+    state = 0
+
+    for i in range(length):
+        remaining = length - i - 1
+
+        for record_index in SORTED_RECORD_INDEXES:
+            next_state = TRANSITIONS[state][record_index]
+
+            if next_state is None:
+                continue
+
+            if position < counts[remaining][next_state]:
+                break
+
+            position -= counts[remaining][next_state]
+
+        records.append(RECORDS[record_index])
+        state = next_state
+
+    return ''.join(records)
+
+def random_pass(length, rand = random, counts = None):
+    """
+    Pick a passing record of a given length uniformly at random.
+    """
+
+    if counts is None:
+        counts = count_suffixes(length)
+
+    return unrank(rand.randrange(counts[length][0]), length, counts)
+
 def generate_pass(length, num_absent = 0, num_late = 0):
     """
     Time: O(3^n)
@@ -107,5 +533,165 @@ class TestGeneratePass (unittest.TestCase):
             'lla',
         })
 
+class TestCountPass (unittest.TestCase):
+    count_impls = {
+        count_pass_dp,
+        count_pass_matrix,
+        count_pass,
+    }
+
+    def test_same_as_generate(self):
+        for length in range(9):
+            expected = len(generate_pass(length))
+
+            for count_impl in self.count_impls:
+                with self.subTest(count_impl, length = length):
+                    self.assertEqual(count_impl(length), expected)
+
+    def test_same_as_is_in_trouble(self):
+        for state in STATES:
+            for record in RECORDS:
+                with self.subTest(state = state, record = record):
+                    prefix = ABSENT * state[0] + LATE * state[1]
+
+                    self.assertEqual(
+                        next_state(state, record) is None,
+                        is_in_trouble(prefix + record))
+
+    def test_large_length(self):
+        self.assertEqual(
+            count_pass_dp(500),
+            count_pass_matrix(500))
+
+        self.assertEqual(
+            count_pass_dp(1000, modulus = 10**9 + 7),
+            count_pass_matrix(1000, modulus = 10**9 + 7))
+
+    def test_huge_length(self):
+        self.assertLess(count_pass(10**18, modulus = 97), 97)
+
+    def test_negative_length(self):
+        for count_impl in self.count_impls | {count_suffixes}:
+            with self.subTest(count_impl):
+                with self.assertRaises(ValueError):
+                    count_impl(-1)
+
+class TestRank (unittest.TestCase):
+    def test_iter_same_as_generate(self):
+        for length in range(7):
+            with self.subTest(length = length):
+                self.assertEqual(
+                    list(iter_pass(length)),
+                    sorted(generate_pass(length)))
+
+    def test_rank_unrank(self):
+        for length in range(7):
+            counts = count_suffixes(length)
+
+            for (position, attendance) in enumerate(iter_pass(length)):
+                with self.subTest(length = length, position = position):
+                    self.assertEqual(rank(attendance, counts), position)
+                    self.assertEqual(
+                        unrank(position, length, counts),
+                        attendance)
+
+    def test_unrank_out_of_bounds(self):
+        for position in [-1, count_pass(5)]:
+            with self.subTest(position = position):
+                with self.assertRaises(IndexError):
+                    unrank(position, 5)
+
+    def test_negative_length(self):
+        counts = count_suffixes(5)
+
+        with self.assertRaises(ValueError):
+            next(iter_pass(-1))
+
+        with self.assertRaises(ValueError):
+            unrank(0, -1, counts)
+
+        with self.assertRaises(ValueError):
+            random_pass(-1)
+
+    def test_rank_in_trouble(self):
+        for attendance in [OK + ABSENT + ABSENT, LATE * 3, 'x']:
+            with self.subTest(attendance = attendance):
+                with self.assertRaises(ValueError):
+                    rank(attendance)
+
+    def test_large_length(self):
+        attendance = (OK + LATE + LATE + ABSENT) + (LATE + OK) * 500
+
+        self.assertEqual(unrank(rank(attendance), len(attendance)), attendance)
+
+    def test_random_pass(self):
+        rand = random.Random(0)
+
+        for i in range(100):
+            attendance = random_pass(20, rand)
+
+            self.assertEqual(len(attendance), 20)
+            self.assertFalse(is_in_trouble(attendance))
+
+class TestScreen (unittest.TestCase):
+    def setUp(self):
+        rand = random.Random(0)
+
+        self.records = [''.join(rand.choice(RECORDS)
+                for j in range(rand.randrange(12)))
+            for i in range(300)]
+
+        self.records.extend(['', OK + ABSENT + LATE * 3, ABSENT * 2])
+        self.expected = [is_in_trouble(record) for record in self.records]
+
+    def assertBitmapMatches(self, bitmap):
+        self.assertEqual(len(bitmap), (len(self.records) + 7) // 8)
+        self.assertEqual(
+            [is_bit_set(bitmap, i) for i in range(len(self.records))],
+            self.expected)
+
+    def test_records(self):
+        for records in [
+                self.records,
+                [record.encode() for record in self.records]]:
+
+            with self.subTest(records = records[-1]):
+                (num_records, bitmap) = screen_records(records)
+
+                self.assertEqual(num_records, len(self.records))
+                self.assertBitmapMatches(bitmap)
+
+    def test_buffer(self):
+        records = '\n'.join(self.records).encode()
+
+        for chunk_size in [1, 7, 100, DEFAULT_CHUNK_SIZE]:
+            for data in [records, records + b'\n']:
+                with self.subTest(chunk_size = chunk_size, data = data[-5:]):
+                    (num_records, bitmap) = screen_buffer(
+                        data, chunk_size = chunk_size)
+
+                    self.assertEqual(num_records, len(self.records))
+                    self.assertBitmapMatches(bitmap)
+
+    def test_file(self):
+        with tempfile.NamedTemporaryFile() as file:
+            file.write('\n'.join(self.records).encode() + b'\n')
+            file.flush()
+
+            for num_processes in [None, 2]:
+                with self.subTest(num_processes = num_processes):
+                    (num_records, bitmap) = screen_file(
+                        file.name, num_processes, chunk_size = 64)
+
+                    self.assertEqual(num_records, len(self.records))
+                    self.assertBitmapMatches(bitmap)
+
+    def test_empty(self):
+        self.assertEqual(screen_records([]), (0, bytearray()))
+        self.assertEqual(screen_buffer(b''), (0, bytearray()))
+
+        with tempfile.NamedTemporaryFile() as file:
+            self.assertEqual(screen_file(file.name), (0, bytearray()))
+
 if __name__ == '__main__':
     unittest.main(verbosity = 2)